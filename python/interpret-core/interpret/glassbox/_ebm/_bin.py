@@ -10,6 +10,13 @@ from ...utils._clean_x import unify_columns
 
 _log = logging.getLogger(__name__)
 
+try:
+    import pandas as pd
+
+    _pandas_installed = True
+except ImportError:
+    _pandas_installed = False
+
 
 _none_list = [None]
 _none_ndarray = np.array(None)
@@ -128,6 +135,70 @@ def eval_terms(X, n_samples, feature_names_in, feature_types_in, bins, term_feat
                         requirements.clear()
 
 
+def ravel_bin_indexes(bin_indexes, shape):
+    # converts the per-dimension bin indexes of a term into indexes of the flattened tensor
+    # so that scores can be gathered with a single np.take instead of N-D fancy indexing,
+    # which is much slower for multiclass tensors.  The -1 index that we use for unknowns
+    # (the last bin) is wrapped here for the inner dimensions, and for the first dimension
+    # the flat index stays negative, which np.take resolves to the last bin like normal
+    # indexing.  An out of range inner index would silently land in a neighbouring bin of
+    # the flat tensor, so check those here and let np.take raise for the first dimension
+
+    if len(bin_indexes) == 1:
+        return bin_indexes[0]
+
+    flat_indexes = np.multiply(bin_indexes[0], shape[1], dtype=np.intp)
+    for dimension_idx in range(1, len(bin_indexes)):
+        if dimension_idx != 1:
+            flat_indexes *= shape[dimension_idx]
+        dim_indexes = bin_indexes[dimension_idx]
+        n_bins = shape[dimension_idx]
+        if len(dim_indexes) != 0 and (
+            dim_indexes.min() < -n_bins or n_bins <= dim_indexes.max()
+        ):
+            msg = f"bin index out of bounds for dimension {dimension_idx} with size {n_bins}"
+            _log.error(msg)
+            raise IndexError(msg)
+        flat_indexes += dim_indexes
+        flat_indexes[dim_indexes < 0] += n_bins
+    return flat_indexes
+
+
+def take_scores(scores, flat_indexes, n_dimensions, buffers=None):
+    # gathers the scores of each sample from a term tensor using the indexes from
+    # ravel_bin_indexes.  If buffers is a dict the result is written into a reusable buffer
+    # instead of a new array.  np.take can only write into a buffer with the same dtype as
+    # the scores, so keep one buffer per dtype.  This lets float32 term tables be used for
+    # scoring while the caller still accumulates the sample scores in float64
+
+    scores = scores.reshape((-1,) + scores.shape[n_dimensions:])
+    if buffers is None:
+        return np.take(scores, flat_indexes, axis=0)
+
+    buffer = buffers.get(scores.dtype)
+    if buffer is None:
+        buffer = np.empty((len(flat_indexes),) + scores.shape[1:], scores.dtype)
+        buffers[scores.dtype] = buffer
+    return np.take(scores, flat_indexes, axis=0, out=buffer)
+
+
+def split_X_rows(X, n_samples, n_chunks):
+    # called under: predict
+
+    # splits precleaned X into n_chunks contiguous blocks of rows that can be scored independently.
+    # Returns a list of (X_chunk, start, stop) or None if we do not split this format of X
+
+    if isinstance(X, np.ndarray) and X.ndim == 2:
+        rows = X
+    elif _pandas_installed and isinstance(X, pd.DataFrame):
+        rows = X.iloc
+    else:
+        return None
+
+    bounds = np.linspace(0, n_samples, n_chunks + 1).astype(np.intp).tolist()
+    return [(rows[start:stop], start, stop) for start, stop in zip(bounds, bounds[1:])]
+
+
 def ebm_decision_function(
     X,
     n_samples,
@@ -147,10 +218,17 @@ def ebm_decision_function(
         )
 
     if 0 < n_samples:
+        # reusable buffers for the scores of a term.  np.take into a preallocated
+        # buffer avoids allocating a new array per term
+        term_buffers = {}
         for term_idx, bin_indexes in eval_terms(
             X, n_samples, feature_names_in, feature_types_in, bins, term_features
         ):
-            sample_scores += term_scores[term_idx][tuple(bin_indexes)]
+            scores = term_scores[term_idx]
+            flat_indexes = ravel_bin_indexes(bin_indexes, scores.shape)
+            sample_scores += take_scores(
+                scores, flat_indexes, len(bin_indexes), term_buffers
+            )
 
     if init_score is not None:
         sample_scores += init_score
@@ -158,6 +236,85 @@ def ebm_decision_function(
     return sample_scores
 
 
+def ebm_decision_function_bagged(
+    X,
+    n_samples,
+    feature_names_in,
+    feature_types_in,
+    bins,
+    intercept,
+    bagged_term_scores,
+    term_features,
+    init_score=None,
+):
+    # called under: fit
+
+    # equivalent to calling ebm_decision_function once per model in bagged_term_scores, but X is only
+    # cleaned and discretized once, and the bin indexes are then shared by all the models
+
+    if type(intercept) is float or len(intercept) == 1:
+        shape = n_samples
+    else:
+        shape = (n_samples, len(intercept))
+    bagged_scores = [
+        np.full(shape, intercept, dtype=np.float64) for _ in bagged_term_scores
+    ]
+
+    if 0 < n_samples:
+        # see ebm_decision_function for why terms use np.take into a buffer.  The
+        # models share the same bins, so the flat indexes are computed once per term
+        term_buffers = {}
+        for term_idx, bin_indexes in eval_terms(
+            X, n_samples, feature_names_in, feature_types_in, bins, term_features
+        ):
+            flat_indexes = ravel_bin_indexes(
+                bin_indexes, bagged_term_scores[0][term_idx].shape
+            )
+            for sample_scores, term_scores in zip(bagged_scores, bagged_term_scores):
+                sample_scores += take_scores(
+                    term_scores[term_idx], flat_indexes, len(bin_indexes), term_buffers
+                )
+
+    if init_score is not None:
+        for sample_scores in bagged_scores:
+            sample_scores += init_score
+
+    return bagged_scores
+
+
+def ebm_decision_function_bagged_lazy(
+    X,
+    n_samples,
+    feature_names_in,
+    feature_types_in,
+    bins,
+    intercept,
+    bagged_term_scores,
+    term_features,
+    bags_per_pass,
+    init_score=None,
+):
+    # called under: fit
+
+    # yields the same per-bag scores as ebm_decision_function_bagged, but only bags_per_pass
+    # bags are scored on each pass through X. The consumer can then process and release each
+    # bag's scores before the next group is made, which bounds the number of full-length
+    # score arrays alive at once instead of holding one per outer bag
+
+    for start in range(0, len(bagged_term_scores), bags_per_pass):
+        yield from ebm_decision_function_bagged(
+            X,
+            n_samples,
+            feature_names_in,
+            feature_types_in,
+            bins,
+            intercept,
+            bagged_term_scores[start : start + bags_per_pass],
+            term_features,
+            init_score,
+        )
+
+
 def ebm_decision_function_and_explain(
     X,
     n_samples,
@@ -182,10 +339,15 @@ def ebm_decision_function_and_explain(
         )
 
     if 0 < n_samples:
+        # each term is gathered once into a reusable buffer and then both added to the
+        # sample scores and stored as the term's contribution
+        term_buffers = {}
         for term_idx, bin_indexes in eval_terms(
             X, n_samples, feature_names_in, feature_types_in, bins, term_features
         ):
-            scores = term_scores[term_idx][tuple(bin_indexes)]
+            scores = term_scores[term_idx]
+            flat_indexes = ravel_bin_indexes(bin_indexes, scores.shape)
+            scores = take_scores(scores, flat_indexes, len(bin_indexes), term_buffers)
             sample_scores += scores
             explanations[:, term_idx] = scores
 
@@ -218,11 +380,14 @@ def make_bin_weights(
 
             dimensions.append(n_bins)
             dim_data = bin_indexes[dimension_idx]
+            # np.where gives us a fresh array, so we can scale it in place without touching the
+            # bin_indexes that eval_terms may share with other terms
             dim_data = np.where(dim_data < 0, n_bins - 1, dim_data)
             if multiple == 1:
                 flat_indexes = dim_data
             else:
-                flat_indexes += dim_data * multiple
+                dim_data *= multiple
+                flat_indexes += dim_data
             multiple *= n_bins
         dimensions = tuple(reversed(dimensions))
 
@@ -2,6 +2,7 @@
 # Distributed under the MIT software license
 
 from ...utils._native import Native, Booster
+from ._tensor import after_boosting
 
 import numpy as np
 
@@ -29,6 +30,7 @@ def boost(
     early_stopping_tolerance,
     noise_scale,
     bin_weights,
+    feature_bin_weights,
     rng,
     objective,
     experimental_params=None,
@@ -91,33 +93,41 @@ def boost(
                     splits = booster.get_term_update_splits()[0]
 
                     term_update_tensor = booster.get_term_update()
-                    noisy_update_tensor = term_update_tensor.copy()
 
                     # Make splits iteration friendly
-                    splits_iter = [0] + list(splits + 1) + [len(term_update_tensor)]
+                    section_bounds = np.concatenate(
+                        ([0], splits + 1, [len(term_update_tensor)])
+                    )
+                    section_starts = section_bounds[:-1]
+                    section_lengths = np.diff(section_bounds)
 
-                    n_sections = len(splits_iter) - 1
+                    n_sections = len(section_starts)
                     noises = native.generate_gaussian_random(
                         rng, noise_scale, n_sections
                     )
 
-                    # Loop through all random splits and add noise before updating
-                    for f, s, noise in zip(splits_iter[:-1], splits_iter[1:], noises):
-                        if s == 1:
-                            # Skip cuts that fall on 0th (missing value) bin -- missing values not supported in DP
-                            continue
-
-                        noisy_update_tensor[f:s] = term_update_tensor[f:s] + noise
+                    # add the noise of each random split to all of its bins at once
+                    # Native code will be returning sums of residuals in slices, not averages.
+                    # Compute noisy average by dividing noisy sum by noisy bin weights
+                    region_weights = np.add.reduceat(
+                        bin_weights[term_idx], section_starts
+                    )
+                    noisy_update_tensor = term_update_tensor + np.repeat(
+                        noises, section_lengths
+                    )
 
-                        # Native code will be returning sums of residuals in slices, not averages.
-                        # Compute noisy average by dividing noisy sum by noisy bin weights
-                        region_weight = np.sum(bin_weights[term_idx][f:s])
-                        noisy_update_tensor[f:s] = (
-                            noisy_update_tensor[f:s] / region_weight
-                        )
+                    first = 0
+                    if section_bounds[1] == 1:
+                        # Skip cuts that fall on 0th (missing value) bin -- missing values not supported in DP
+                        # Its weight is usually 0, so it must not be a divisor either
+                        noisy_update_tensor[0] = term_update_tensor[0]
+                        first = 1
+                    noisy_update_tensor[section_bounds[first] :] /= np.repeat(
+                        region_weights[first:], section_lengths[first:]
+                    )
 
                     # Invert gradients before updates
-                    noisy_update_tensor = -noisy_update_tensor
+                    np.negative(noisy_update_tensor, out=noisy_update_tensor)
                     booster.set_term_update(term_idx, noisy_update_tensor)
 
                 cur_metric = booster.apply_term_update()
@@ -173,4 +183,7 @@ def boost(
         else:
             model_update = booster.get_current_model()
 
+    # trim the tensors here instead of in the caller so that the bags do it in parallel
+    model_update = after_boosting(term_features, model_update, feature_bin_weights)
+
     return model_update, episode_index, rng
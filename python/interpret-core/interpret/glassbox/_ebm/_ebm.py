@@ -11,15 +11,16 @@ from ._boost import boost
 from ._utils import (
     make_bag,
     jsonify_item,
-    jsonify_lists,
+    jsonify_array,
     process_terms,
     order_terms,
     remove_unused_higher_bins,
     deduplicate_bins,
+    remove_duplicate_terms,
     generate_term_names,
     generate_term_types,
 )
-from ...utils._histogram import make_all_histogram_edges
+from ...utils._histogram import make_all_histogram_edges, make_bounded_edges
 from ...utils._link import inv_link
 from ...utils._seed import normalize_initial_seed
 from ...utils._clean_x import preclean_X
@@ -37,14 +38,16 @@ from ...utils._compressed_dataset import bin_native_by_dimension
 from ._bin import (
     eval_terms,
     ebm_decision_function,
+    ebm_decision_function_bagged_lazy,
     ebm_decision_function_and_explain,
     make_bin_weights,
+    split_X_rows,
+    ravel_bin_indexes,
+    take_scores,
 )
 from ._tensor import (
     make_boosting_weights,
-    after_boosting,
-    remove_last,
-    trim_tensor,
+    make_graph_slices,
 )
 from ...utils._native import Native
 from ...api.base import ExplainerMixin
@@ -68,25 +71,24 @@ from math import isnan, ceil
 import numpy as np
 from warnings import warn
 
-from sklearn.base import is_classifier, is_regressor  # type: ignore
+from sklearn.base import is_classifier  # type: ignore
 from sklearn.utils.validation import check_is_fitted  # type: ignore
-from sklearn.isotonic import IsotonicRegression
-
-import heapq
-import operator
+from joblib import effective_n_jobs
 
 from sklearn.base import (
     BaseEstimator,
     ClassifierMixin,
     RegressorMixin,
 )  # type: ignore
-from sklearn.utils.extmath import softmax  # type: ignore
-from itertools import combinations, groupby
+from itertools import groupby
 
 import logging
 
 _log = logging.getLogger(__name__)
 
+# below this many samples per thread, decision_function scores X on the calling thread
+_min_samples_per_job = 20000
+
 
 class EBMExplanation(FeatureValueExplanation):
     """Visualizes specifically for EBM."""
@@ -545,6 +547,10 @@ class EBMModel(BaseEstimator):
                 _log.error(msg)
                 raise ValueError(msg)
             sample_weight = sample_weight.astype(np.float64, copy=False)
+            if (sample_weight == 1.0).all():
+                # all ones is identical to unweighted. Dropping the weights lets the
+                # native code skip loading and multiplying by a weight per sample
+                sample_weight = None
 
         native = Native.get_native_singleton()
         link, link_param = native.determine_link(objective)
@@ -646,6 +652,7 @@ class EBMModel(BaseEstimator):
             delta=bin_delta,
             composition=composition,
             privacy_bounds=privacy_bounds,
+            n_jobs=self.n_jobs,
         )
         feature_names_in = binning_result[0]
         feature_types_in = binning_result[1]
@@ -782,10 +789,11 @@ class EBMModel(BaseEstimator):
                 "Only 1 class detected for classification. The model will predict 1.0 whenever predict_proba is called."
             )
 
-            breakpoint_iteration = [[]]
+            # one row per boosting stage, with one column per outer bag
+            breakpoint_iteration = np.zeros((2, self.outer_bags), np.int64)
+            n_stages = 1
             models = []
             for idx in range(self.outer_bags):
-                breakpoint_iteration[-1].append(0)
                 tensors = []
                 for bin_levels in bins:
                     feature_bins = bin_levels[0]
@@ -803,7 +811,10 @@ class EBMModel(BaseEstimator):
                     tensors.append(tensor)
                 models.append(tensors)
         else:
-            provider = JobLibProvider(n_jobs=self.n_jobs)
+            # boosting and interaction detection spend their time inside native calls
+            # that release the GIL, so threads run the bags in parallel without
+            # spawning worker processes or pickling the dataset, bags, and scores
+            provider = JobLibProvider(n_jobs=self.n_jobs, backend="threading")
 
             dataset = bin_native_by_dimension(
                 n_classes,
@@ -842,6 +853,7 @@ class EBMModel(BaseEstimator):
                         early_stopping_tolerance,
                         noise_scale_boosting,
                         bin_data_weights,
+                        main_bin_weights,
                         rngs[idx],
                         objective,
                         None,
@@ -854,12 +866,16 @@ class EBMModel(BaseEstimator):
             del parallel_args  # parallel_args holds references to dataset, so must be deleted
             del dataset
 
-            breakpoint_iteration = [[]]
+            # one row per boosting stage, with one column per outer bag
+            breakpoint_iteration = np.zeros((2, self.outer_bags), np.int64)
+            n_stages = 1
             models = []
             rngs = []
-            for model, bag_breakpoint_iteration, bagged_rng in results:
-                breakpoint_iteration[-1].append(bag_breakpoint_iteration)
-                models.append(after_boosting(term_features, model, main_bin_weights))
+            for idx, (model, bag_breakpoint_iteration, bagged_rng) in enumerate(
+                results
+            ):
+                breakpoint_iteration[0, idx] = bag_breakpoint_iteration
+                models.append(model)
                 rngs.append(
                     bagged_rng
                 )  # retrieve our rng state since this was used outside of our process
@@ -911,23 +927,11 @@ class EBMModel(BaseEstimator):
                 initial_intercept = np.zeros(
                     Native.get_count_scores_c(n_classes), np.float64
                 )
-                scores_bags = []
-                for model in models:
-                    # TODO: instead of going back to the original data in X, we
-                    # could use the compressed and already binned data in dataset
-                    scores_bags.append(
-                        ebm_decision_function(
-                            X,
-                            n_samples,
-                            feature_names_in,
-                            feature_types_in,
-                            bins,
-                            initial_intercept,
-                            model,
-                            term_features,
-                            init_score,
-                        )
-                    )
+                # score only as many bags per pass over X as can run at once. joblib pulls
+                # the parallel arguments lazily, so the full-length score arrays are made
+                # shortly before they are needed and released when each bag finishes
+                # instead of holding one per outer bag for the entire interaction stage
+                bags_per_pass = effective_n_jobs(self.n_jobs)
 
                 dataset = bin_native_by_dimension(
                     n_classes,
@@ -944,23 +948,43 @@ class EBMModel(BaseEstimator):
                 if isinstance(interactions, int):
                     _log.info("Estimating with FAST")
 
-                    parallel_args = []
-                    for idx in range(self.outer_bags):
-                        # TODO: the combinations below should be selected from the non-excluded features
-                        parallel_args.append(
-                            (
-                                dataset,
-                                bags[idx],
-                                scores_bags[idx],
-                                combinations(range(n_features_in), 2),
-                                exclude,
-                                Native.InteractionFlags_Default,
-                                max_cardinality,
-                                min_samples_leaf,
-                                objective,
-                                None,
-                            )
+                    # build the pairs once as a compact (n_pairs, 2) array that every bag shares.  The rows
+                    # are in the same order that combinations(range(n_features_in), 2) would produce
+                    # TODO: the combinations below should be selected from the non-excluded features
+                    pairs = np.column_stack(np.triu_indices(n_features_in, 1)).astype(
+                        np.int64, copy=False
+                    )
+
+                    # TODO: instead of going back to the original data in X, we
+                    # could use the compressed and already binned data in dataset
+                    scores_bags = ebm_decision_function_bagged_lazy(
+                        X,
+                        n_samples,
+                        feature_names_in,
+                        feature_types_in,
+                        bins,
+                        initial_intercept,
+                        models,
+                        term_features,
+                        bags_per_pass,
+                        init_score,
+                    )
+
+                    parallel_args = (
+                        (
+                            dataset,
+                            bags[idx],
+                            scores,
+                            pairs,
+                            exclude,
+                            Native.InteractionFlags_Default,
+                            max_cardinality,
+                            min_samples_leaf,
+                            objective,
+                            None,
                         )
+                        for idx, scores in enumerate(scores_bags)
+                    )
 
                     bagged_ranked_interaction = provider.parallel(
                         rank_interactions, parallel_args
@@ -969,51 +993,53 @@ class EBMModel(BaseEstimator):
                     # this holds references to dataset, bags, and scores_bags which we want python to reclaim later
                     del parallel_args
 
-                    # Select merged pairs
-                    pair_ranks = {}
-                    for n, interaction_strengths_and_indices in enumerate(
-                        bagged_ranked_interaction
-                    ):
-                        interaction_indices = list(
-                            map(
-                                operator.itemgetter(1),
-                                interaction_strengths_and_indices,
-                            )
+                    # Select merged pairs.  The rows of pairs are in lexicographic order, so the
+                    # row of pair (i, j) is computed directly from the feature indexes.  Every bag
+                    # ranks the same pairs, so the mean rank of each pair is a grouped mean
+                    bagged_pair_idxs = []
+                    for interaction_strengths_and_indices in bagged_ranked_interaction:
+                        indices = np.array(
+                            [
+                                feature_idxs
+                                for _, feature_idxs in interaction_strengths_and_indices
+                            ],
+                            np.int64,
+                        ).reshape(-1, 2)
+                        i = indices[:, 0]
+                        bagged_pair_idxs.append(
+                            i * (2 * n_features_in - i - 1) // 2 + indices[:, 1] - i - 1
                         )
-                        for rank, indices in enumerate(interaction_indices):
-                            old_mean = pair_ranks.get(indices, 0)
-                            pair_ranks[indices] = old_mean + (
-                                (rank - old_mean) / (n + 1)
-                            )
-
-                    final_ranks = []
-                    total_interactions = 0
-                    for indices in pair_ranks:
-                        heapq.heappush(final_ranks, (pair_ranks[indices], indices))
-                        total_interactions += 1
-
-                    n_interactions = min(interactions, total_interactions)
-                    boost_groups = [
-                        heapq.heappop(final_ranks)[1] for _ in range(n_interactions)
+                    pair_idxs = np.concatenate(bagged_pair_idxs)
+                    ranks = np.concatenate(
+                        [
+                            np.arange(len(idxs), dtype=np.float64)
+                            for idxs in bagged_pair_idxs
+                        ]
+                    )
+                    rank_counts = np.bincount(pair_idxs, minlength=len(pairs))
+                    is_ranked = rank_counts != 0
+                    pair_ranks = np.bincount(
+                        pair_idxs, weights=ranks, minlength=len(pairs)
+                    ) / np.maximum(rank_counts, 1)
+
+                    # a stable sort orders pairs with equal mean ranks by (i, j), which is
+                    # the order that the (mean_rank, indices) tuples used to come off the heap
+                    ranked_idxs = np.flatnonzero(is_ranked)
+                    top_idxs = ranked_idxs[
+                        np.argsort(pair_ranks[ranked_idxs], kind="stable")[
+                            :interactions
+                        ]
                     ]
+                    boost_groups = list(map(tuple, pairs[top_idxs].tolist()))
                 else:
+                    # clean these up since we expose them publically inside self.term_features_
+                    interactions = [
+                        tuple(map(int, feature_idxs)) for feature_idxs in interactions
+                    ]
+                    max_dimensions = max(map(len, interactions))
+
                     # Check and remove duplicate interaction terms
-                    uniquifier = set()
-                    boost_groups = []
-                    max_dimensions = 0
-
-                    for feature_idxs in interactions:
-                        # clean these up since we expose them publically inside self.term_features_
-                        feature_idxs = tuple(map(int, feature_idxs))
-
-                        max_dimensions = max(max_dimensions, len(feature_idxs))
-                        sorted_tuple = tuple(sorted(feature_idxs))
-                        if (
-                            sorted_tuple not in uniquifier
-                            and sorted_tuple not in exclude
-                        ):
-                            uniquifier.add(sorted_tuple)
-                            boost_groups.append(feature_idxs)
+                    boost_groups = remove_duplicate_terms(interactions, exclude)
 
                     # Warn the users that we have made change to the interactions list
                     if len(boost_groups) != len(interactions):
@@ -1026,37 +1052,53 @@ class EBMModel(BaseEstimator):
                             "available and exact."
                         )
 
-                parallel_args = []
+                scores_bags = ebm_decision_function_bagged_lazy(
+                    X,
+                    n_samples,
+                    feature_names_in,
+                    feature_types_in,
+                    bins,
+                    initial_intercept,
+                    models,
+                    term_features,
+                    bags_per_pass,
+                    init_score,
+                )
+
+                early_stopping_rounds_bags = []
                 for idx in range(self.outer_bags):
                     early_stopping_rounds_local = early_stopping_rounds
                     if bags[idx] is None or (0 <= bags[idx]).all():
                         # if there are no validation samples, turn off early stopping
                         # because the validation metric cannot improve each round
                         early_stopping_rounds_local = 0
+                    early_stopping_rounds_bags.append(early_stopping_rounds_local)
 
-                    parallel_args.append(
-                        (
-                            dataset,
-                            bags[idx],
-                            scores_bags[idx],
-                            boost_groups,
-                            inner_bags,
-                            boost_flags,
-                            self.learning_rate,
-                            min_samples_leaf,
-                            self.max_leaves,
-                            greediness,
-                            0,  # no smoothing rounds for interactions
-                            self.max_rounds,
-                            early_stopping_rounds_local,
-                            early_stopping_tolerance,
-                            noise_scale_boosting,
-                            bin_data_weights,
-                            rngs[idx],
-                            objective,
-                            None,
-                        )
+                parallel_args = (
+                    (
+                        dataset,
+                        bags[idx],
+                        scores,
+                        boost_groups,
+                        inner_bags,
+                        boost_flags,
+                        self.learning_rate,
+                        min_samples_leaf,
+                        self.max_leaves,
+                        greediness,
+                        0,  # no smoothing rounds for interactions
+                        self.max_rounds,
+                        early_stopping_rounds_bags[idx],
+                        early_stopping_tolerance,
+                        noise_scale_boosting,
+                        bin_data_weights,
+                        main_bin_weights,
+                        rngs[idx],
+                        objective,
+                        None,
                     )
+                    for idx, scores in enumerate(scores_bags)
+                )
 
                 results = provider.parallel(boost, parallel_args)
 
@@ -1065,27 +1107,33 @@ class EBMModel(BaseEstimator):
                 del dataset
                 del scores_bags
 
-                breakpoint_iteration.append([])
+                n_stages = 2
                 for idx in range(self.outer_bags):
-                    breakpoint_iteration[-1].append(results[idx][1])
-                    models[idx].extend(
-                        after_boosting(boost_groups, results[idx][0], main_bin_weights)
-                    )
+                    breakpoint_iteration[1, idx] = results[idx][1]
+                    models[idx].extend(results[idx][0])
                     rngs[idx] = results[idx][2]
 
                 term_features.extend(boost_groups)
 
                 break  # do not loop!
 
-        breakpoint_iteration = np.array(breakpoint_iteration, np.int64)
+        breakpoint_iteration = breakpoint_iteration[:n_stages].copy()
 
         remove_unused_higher_bins(term_features, bins)
         deduplicate_bins(bins)
 
-        bagged_scores = (
-            np.array([model[idx] for model in models], np.float64)
-            for idx in range(len(term_features))
-        )
+        # write each bag's tensor into a preallocated (n_bags, ...) array per term and
+        # drop the per-bag tensor as we go so that both copies are never held together
+        bagged_scores = []
+        for term_idx in range(len(term_features)):
+            tensors = np.empty(
+                (len(models),) + models[0][term_idx].shape, dtype=np.float64
+            )
+            for bag_idx, model in enumerate(models):
+                tensors[bag_idx] = model[term_idx]
+                model[term_idx] = None
+            bagged_scores.append(tensors)
+        del models
 
         term_features, bagged_scores = order_terms(term_features, bagged_scores)
 
@@ -1108,6 +1156,10 @@ class EBMModel(BaseEstimator):
                 term_features,
             )
 
+        # X is not used past this point. If preclean_X made a copy (eg: from a DataFrame)
+        # let python reclaim it before process_terms allocates its copies of the bagged scores
+        del X
+
         term_scores, standard_deviations, intercept, bagged_scores = process_terms(
             n_classes, bagged_scores, bin_weights, bag_weights
         )
@@ -1219,7 +1271,7 @@ class EBMModel(BaseEstimator):
             # for our JSON format to harmonize the cross-language representation
             j["intercept"] = [jsonify_item(self.intercept_)]
         else:
-            j["intercept"] = jsonify_lists(self.intercept_.tolist())
+            j["intercept"] = jsonify_array(self.intercept_)
 
         if 3 <= level:
             noise_scale_binning = getattr(self, "noise_scale_binning_", None)
@@ -1231,7 +1283,7 @@ class EBMModel(BaseEstimator):
         if 2 <= level:
             bag_weights = getattr(self, "bag_weights_", None)
             if bag_weights is not None:
-                j["bag_weights"] = jsonify_lists(bag_weights.tolist())
+                j["bag_weights"] = jsonify_array(bag_weights)
         if 3 <= level:
             breakpoint_iteration = getattr(self, "breakpoint_iteration_", None)
             if breakpoint_iteration is not None:
@@ -1384,23 +1436,19 @@ class EBMModel(BaseEstimator):
                 self.feature_names_in_[feature_idx]
                 for feature_idx in self.term_features_[term_idx]
             ]
-            term["scores"] = jsonify_lists(self.term_scores_[term_idx].tolist())
+            term["scores"] = jsonify_array(self.term_scores_[term_idx])
             if 1 <= level:
                 if standard_deviations_all is not None:
                     standard_deviations = standard_deviations_all[term_idx]
                     if standard_deviations is not None:
-                        term["standard_deviations"] = jsonify_lists(
-                            standard_deviations.tolist()
-                        )
+                        term["standard_deviations"] = jsonify_array(standard_deviations)
             if 2 <= level:
                 if bagged_scores_all is not None:
                     bagged_scores = bagged_scores_all[term_idx]
                     if bagged_scores is not None:
-                        term["bagged_scores"] = jsonify_lists(bagged_scores.tolist())
+                        term["bagged_scores"] = jsonify_array(bagged_scores)
             if 1 <= level:
-                term["bin_weights"] = jsonify_lists(
-                    self.bin_weights_[term_idx].tolist()
-                )
+                term["bin_weights"] = jsonify_array(self.bin_weights_[term_idx])
 
             terms.append(term)
         j["terms"] = terms
@@ -1485,21 +1533,14 @@ class EBMModel(BaseEstimator):
         outer = self._to_outer_jsonable(properties)
         return json.dumps(outer, allow_nan=False, indent=2)
 
-    def decision_function(self, X, init_score=None):
-        """Predict scores from model before calling the link function.
-
-        Args:
-            X: Numpy array for samples.
-            init_score: Optional. Either a model that can generate scores or per-sample initialization score.
-                If samples scores it should be the same length as X.
-
-        Returns:
-            The sum of the additive term contributions.
-        """
+    def _clean_X_and_init_score(self, X, init_score, n_samples=None):
+        # the shared preamble of the predict and explain methods
         check_is_fitted(self, "has_fitted_")
 
         if init_score is None:
-            X, n_samples = preclean_X(X, self.feature_names_in_, self.feature_types_in_)
+            X, n_samples = preclean_X(
+                X, self.feature_names_in_, self.feature_types_in_, n_samples
+            )
         else:
             init_score, X, n_samples = clean_init_score_and_X(
                 self.link_,
@@ -1508,10 +1549,50 @@ class EBMModel(BaseEstimator):
                 X,
                 self.feature_names_in_,
                 self.feature_types_in_,
+                n_samples,
             )
+        return X, n_samples, init_score
+
+    def decision_function(self, X, init_score=None):
+        """Predict scores from model before calling the link function.
+
+        Args:
+            X: Numpy array for samples.
+            init_score: Optional. Either a model that can generate scores or per-sample initialization score.
+                If samples scores it should be the same length as X.
+
+        Returns:
+            The sum of the additive term contributions.
+        """
+        X, n_samples, init_score = self._clean_X_and_init_score(X, init_score)
 
         # TODO: handle the 1 class case here
 
+        # scoring spends most of its time in native discretization and numpy operations that
+        # release the GIL, so large batches are split into blocks of rows scored on threads.
+        # Merged models do not have n_jobs, so they are scored on the calling thread
+        n_jobs = effective_n_jobs(getattr(self, "n_jobs", 1))
+        n_chunks = min(n_jobs, n_samples // _min_samples_per_job)
+        chunks = None if n_chunks <= 1 else split_X_rows(X, n_samples, n_chunks)
+        if chunks is not None:
+            parallel_args = [
+                (
+                    X_chunk,
+                    stop - start,
+                    self.feature_names_in_,
+                    self.feature_types_in_,
+                    self.bins_,
+                    self.intercept_,
+                    self.term_scores_,
+                    self.term_features_,
+                    None if init_score is None else init_score[start:stop],
+                )
+                for X_chunk, start, stop in chunks
+            ]
+            provider = JobLibProvider(n_jobs=n_chunks, backend="threading")
+            scores = provider.parallel(ebm_decision_function, parallel_args)
+            return np.concatenate(scores)
+
         return ebm_decision_function(
             X,
             n_samples,
@@ -1542,40 +1623,55 @@ class EBMModel(BaseEstimator):
         # Obtain min/max for model scores
         lower_bound = np.inf
         upper_bound = -np.inf
-        for scores, errors in zip(self.term_scores_, self.standard_deviations_):
-            if errors is None:
-                lower_bound = min(lower_bound, np.min(scores))
-                upper_bound = max(upper_bound, np.max(scores))
-            else:
-                lower_bound = min(lower_bound, np.min(scores - errors))
-                upper_bound = max(upper_bound, np.max(scores + errors))
+        if len(self.term_scores_) != 0:
+            # reuse one buffer sized for the largest term instead of allocating
+            # scores - errors and scores + errors for every term
+            bounds_buffer = np.empty(max(map(np.size, self.term_scores_)), np.float64)
+            for scores, errors in zip(self.term_scores_, self.standard_deviations_):
+                if errors is None:
+                    lower_bound = min(lower_bound, np.min(scores))
+                    upper_bound = max(upper_bound, np.max(scores))
+                else:
+                    buffer = bounds_buffer[: scores.size].reshape(scores.shape)
+                    np.subtract(scores, errors, out=buffer)
+                    lower_bound = min(lower_bound, np.min(buffer))
+                    np.add(scores, errors, out=buffer)
+                    upper_bound = max(upper_bound, np.max(buffer))
 
         bounds = (lower_bound, upper_bound)
 
-        mod_weights = remove_last(self.bin_weights_, self.bin_weights_)
-        mod_term_scores = remove_last(self.term_scores_, self.bin_weights_)
-        mod_standard_deviations = remove_last(
-            self.standard_deviations_, self.bin_weights_
-        )
-        for term_idx, feature_idxs in enumerate(self.term_features_):
-            mod_term_scores[term_idx] = trim_tensor(
-                mod_term_scores[term_idx], trim_low=[True] * len(feature_idxs)
-            )
-            if mod_standard_deviations[term_idx] is not None:
-                mod_standard_deviations[term_idx] = trim_tensor(
-                    mod_standard_deviations[term_idx],
-                    trim_low=[True] * len(feature_idxs),
-                )
-            if mod_weights[term_idx] is not None:
-                mod_weights[term_idx] = trim_tensor(
-                    mod_weights[term_idx], trim_low=[True] * len(feature_idxs)
-                )
+        # find the missing/unknown bins to drop once per term and share them between the
+        # scores, standard deviations, and weights of the term
+        graph_slices = make_graph_slices(self.term_features_, self.bin_weights_)
+        mod_weights = [
+            None if weights is None else weights[slices]
+            for weights, slices in zip(self.bin_weights_, graph_slices)
+        ]
+        mod_term_scores = [
+            scores[slices] for scores, slices in zip(self.term_scores_, graph_slices)
+        ]
+        mod_standard_deviations = [
+            None if errors is None else errors[slices]
+            for errors, slices in zip(self.standard_deviations_, graph_slices)
+        ]
 
         term_names = self.term_names_
         term_types = generate_term_types(self.feature_types_in_, self.term_features_)
 
         native = Native.get_native_singleton()
 
+        # these attributes are optional on edited or merged models.  Look them up once
+        # instead of once per term
+        histogram_weights_all = getattr(self, "histogram_weights_", None)
+        histogram_edges_all = getattr(self, "histogram_edges_", None)
+        feature_bounds = getattr(self, "feature_bounds_", None)
+        label_names = None
+        if is_classifier(self):
+            # Classes should be numpy array, convert to list.
+            label_names = self.classes_.tolist()
+
+        pair_bin_labels_cache = {}
+
         # Add per feature graph
         data_dicts = []
         feature_list = []
@@ -1599,9 +1695,9 @@ class EBMModel(BaseEstimator):
                     # TODO: this will fail if we have multiple categories in a bin
                     bin_labels = list(feature_bins.keys())
 
-                    histogram_weights = getattr(self, "histogram_weights_", None)
-                    if histogram_weights is not None:
-                        histogram_weights = histogram_weights[feature_index0]
+                    histogram_weights = None
+                    if histogram_weights_all is not None:
+                        histogram_weights = histogram_weights_all[feature_index0]
 
                     if histogram_weights is None:
                         histogram_weights = self.bin_weights_[term_idx]
@@ -1618,7 +1714,6 @@ class EBMModel(BaseEstimator):
                     # continuous
                     min_feature_val = np.nan
                     max_feature_val = np.nan
-                    feature_bounds = getattr(self, "feature_bounds_", None)
                     if feature_bounds is not None:
                         min_feature_val = feature_bounds[feature_index0, 0]
                         max_feature_val = feature_bounds[feature_index0, 1]
@@ -1628,15 +1723,15 @@ class EBMModel(BaseEstimator):
                         feature_bins, min_feature_val, max_feature_val
                     )
                     bin_labels = list(
-                        np.concatenate(([min_graph], feature_bins, [max_graph]))
+                        make_bounded_edges(min_graph, feature_bins, max_graph)
                     )
 
-                    histogram_edges = getattr(self, "histogram_edges_", None)
-                    if histogram_edges is not None:
-                        histogram_edges = histogram_edges[feature_index0]
+                    histogram_edges = None
+                    if histogram_edges_all is not None:
+                        histogram_edges = histogram_edges_all[feature_index0]
                     if histogram_edges is not None:
                         names = list(histogram_edges)
-                        densities = list(self.histogram_weights_[feature_index0][1:-1])
+                        densities = list(histogram_weights_all[feature_index0][1:-1])
                     else:
                         names = bin_labels
                         densities = list(mod_weights[term_idx])
@@ -1672,66 +1767,47 @@ class EBMModel(BaseEstimator):
                         "scores": densities,
                     },
                 }
-                if is_classifier(self):
-                    data_dict["meta"] = {
-                        "label_names": self.classes_.tolist()  # Classes should be numpy array, convert to list.
-                    }
+                if label_names is not None:
+                    data_dict["meta"] = {"label_names": label_names}
 
                 data_dicts.append(data_dict)
             elif len(feature_idxs) == 2:
                 keep_idxs.append(term_idx)
 
-                bin_levels = self.bins_[feature_idxs[0]]
-                feature_bins = bin_levels[min(len(feature_idxs), len(bin_levels)) - 1]
-                if isinstance(feature_bins, dict):
-                    # categorical
-                    bin_labels = list(feature_bins.keys())
-                    if len(bin_labels) != model_graph.shape[0]:
-                        bin_labels.append("DPOther")
-                else:
-                    # continuous
-                    min_feature_val = np.nan
-                    max_feature_val = np.nan
-                    feature_bounds = getattr(self, "feature_bounds_", None)
-                    if feature_bounds is not None:
-                        min_feature_val = feature_bounds[feature_idxs[0], 0]
-                        max_feature_val = feature_bounds[feature_idxs[0], 1]
-
-                    # this will have no effect in normal models, but will handle inconsistent editied models
-                    min_graph, max_graph = native.suggest_graph_bounds(
-                        feature_bins, min_feature_val, max_feature_val
-                    )
-                    bin_labels = list(
-                        np.concatenate(([min_graph], feature_bins, [max_graph]))
-                    )
-
-                bin_labels_left = bin_labels
-
-                bin_levels = self.bins_[feature_idxs[1]]
-                feature_bins = bin_levels[min(len(feature_idxs), len(bin_levels)) - 1]
-                if isinstance(feature_bins, dict):
-                    # categorical
-                    bin_labels = list(feature_bins.keys())
-                    if len(bin_labels) != model_graph.shape[1]:
-                        bin_labels.append("DPOther")
-                else:
-                    # continuous
-                    min_feature_val = np.nan
-                    max_feature_val = np.nan
-                    feature_bounds = getattr(self, "feature_bounds_", None)
-                    if feature_bounds is not None:
-                        min_feature_val = feature_bounds[feature_idxs[1], 0]
-                        max_feature_val = feature_bounds[feature_idxs[1], 1]
-
-                    # this will have no effect in normal models, but will handle inconsistent editied models
-                    min_graph, max_graph = native.suggest_graph_bounds(
-                        feature_bins, min_feature_val, max_feature_val
-                    )
-                    bin_labels = list(
-                        np.concatenate(([min_graph], feature_bins, [max_graph]))
-                    )
+                pair_bin_labels = []
+                for dimension_idx, feature_idx in enumerate(feature_idxs):
+                    bin_levels = self.bins_[feature_idx]
+                    level_idx = min(len(feature_idxs), len(bin_levels)) - 1
+                    n_bins = model_graph.shape[dimension_idx]
+                    # features are usually in several pairs, so build their labels once
+                    key = (feature_idx, level_idx, n_bins)
+                    bin_labels = pair_bin_labels_cache.get(key)
+                    if bin_labels is None:
+                        feature_bins = bin_levels[level_idx]
+                        if isinstance(feature_bins, dict):
+                            # categorical
+                            bin_labels = list(feature_bins.keys())
+                            if len(bin_labels) != n_bins:
+                                bin_labels.append("DPOther")
+                        else:
+                            # continuous
+                            min_feature_val = np.nan
+                            max_feature_val = np.nan
+                            if feature_bounds is not None:
+                                min_feature_val = feature_bounds[feature_idx, 0]
+                                max_feature_val = feature_bounds[feature_idx, 1]
+
+                            # this will have no effect in normal models, but will handle inconsistent editied models
+                            min_graph, max_graph = native.suggest_graph_bounds(
+                                feature_bins, min_feature_val, max_feature_val
+                            )
+                            bin_labels = list(
+                                make_bounded_edges(min_graph, feature_bins, max_graph)
+                            )
+                        pair_bin_labels_cache[key] = bin_labels
+                    pair_bin_labels.append(bin_labels)
 
-                bin_labels_right = bin_labels
+                bin_labels_left, bin_labels_right = pair_bin_labels
 
                 feature_dict = {
                     "type": "interaction",
@@ -1759,9 +1835,12 @@ class EBMModel(BaseEstimator):
 
         importances = self.term_importances()
 
+        keep_names = [term_names[i] for i in keep_idxs]
+        keep_types = [term_types[i] for i in keep_idxs]
+
         overall_dict = {
             "type": "univariate",
-            "names": [term_names[i] for i in keep_idxs],
+            "names": keep_names,
             "scores": [importances[i] for i in keep_idxs],
         }
         internal_obj = {
@@ -1779,13 +1858,13 @@ class EBMModel(BaseEstimator):
         return EBMExplanation(
             "global",
             internal_obj,
-            feature_names=[term_names[i] for i in keep_idxs],
-            feature_types=[term_types[i] for i in keep_idxs],
+            feature_names=keep_names,
+            feature_types=keep_types,
             name=name,
             selector=gen_global_selector(
                 self.n_features_in_,
-                [term_names[i] for i in keep_idxs],
-                [term_types[i] for i in keep_idxs],
+                keep_names,
+                keep_types,
                 getattr(self, "unique_val_counts_", None),
                 None,
             ),
@@ -1823,20 +1902,9 @@ class EBMModel(BaseEstimator):
             else:
                 y = y.astype(np.float64, copy=False)
 
-        if init_score is None:
-            X, n_samples = preclean_X(
-                X, self.feature_names_in_, self.feature_types_in_, n_samples
-            )
-        else:
-            init_score, X, n_samples = clean_init_score_and_X(
-                self.link_,
-                self.link_param_,
-                init_score,
-                X,
-                self.feature_names_in_,
-                self.feature_types_in_,
-                n_samples,
-            )
+        X, n_samples, init_score = self._clean_X_and_init_score(
+            X, init_score, n_samples
+        )
 
         term_names = self.term_names_
         term_types = generate_term_types(self.feature_types_in_, self.term_features_)
@@ -1855,24 +1923,9 @@ class EBMModel(BaseEstimator):
                 if isinstance(intercept, np.ndarray) or isinstance(intercept, list):
                     intercept = intercept[0]
 
-            for _ in range(n_samples):
-                data_dict = {
-                    "type": "univariate",
-                    "names": [None] * len(self.term_features_),
-                    "scores": [None] * len(self.term_features_),
-                    "values": [None] * len(self.term_features_),
-                    "extra": {
-                        "names": ["Intercept"],
-                        "scores": [intercept],
-                        "values": [1],
-                    },
-                }
-                if is_classifier(self):
-                    data_dict["meta"] = {
-                        "label_names": self.classes_.tolist()  # Classes should be numpy array, convert to list.
-                    }
-                data_dicts.append(data_dict)
-
+            n_terms = len(self.term_features_)
+            scores_matrix = None
+            values_matrix = np.full((n_samples, n_terms), "", np.object_)
             for term_idx, bin_indexes in eval_terms(
                 X,
                 n_samples,
@@ -1881,18 +1934,40 @@ class EBMModel(BaseEstimator):
                 self.bins_,
                 self.term_features_,
             ):
-                scores = self.term_scores_[term_idx][tuple(bin_indexes)]
+                scores = self.term_scores_[term_idx]
+                flat_indexes = ravel_bin_indexes(bin_indexes, scores.shape)
+                scores = take_scores(scores, flat_indexes, len(bin_indexes))
+                if scores_matrix is None:
+                    # multiclass scores have an extra dimension for the classes
+                    scores_matrix = np.empty(
+                        (n_samples, n_terms) + scores.shape[1:], np.float64
+                    )
+                scores_matrix[:, term_idx] = scores
                 feature_idxs = self.term_features_[term_idx]
-                for row_idx in range(n_samples):
-                    term_name = term_names[term_idx]
-                    data_dicts[row_idx]["names"][term_idx] = term_name
-                    data_dicts[row_idx]["scores"][term_idx] = scores[row_idx]
-                    if len(feature_idxs) == 1:
-                        data_dicts[row_idx]["values"][term_idx] = X_unified[
-                            row_idx, feature_idxs[0]
-                        ]
-                    else:
-                        data_dicts[row_idx]["values"][term_idx] = ""
+                if len(feature_idxs) == 1:
+                    values_matrix[:, term_idx] = X_unified[:, feature_idxs[0]]
+
+            if scores_matrix is None:
+                scores_matrix = np.empty((n_samples, 0), np.float64)
+
+            # Classes should be numpy array, convert to list.
+            label_names = self.classes_.tolist() if is_classifier(self) else None
+
+            for row_idx in range(n_samples):
+                data_dict = {
+                    "type": "univariate",
+                    "names": list(term_names),
+                    "scores": list(scores_matrix[row_idx]),
+                    "values": values_matrix[row_idx].tolist(),
+                    "extra": {
+                        "names": ["Intercept"],
+                        "scores": [intercept],
+                        "values": [1],
+                    },
+                }
+                if label_names is not None:
+                    data_dict["meta"] = {"label_names": list(label_names)}
+                data_dicts.append(data_dict)
 
             # TODO: handle the 1 class case here
 
@@ -1908,7 +1983,7 @@ class EBMModel(BaseEstimator):
                 init_score,
             )
             n_classes = len(self.classes_) if is_classifier(self) else -1
-            pred = inv_link(self.link_, self.link_param_, pred, n_classes)
+            pred = inv_link(self.link_, self.link_param_, pred, n_classes, False)
 
             classes = self.classes_ if is_classifier(self) else None
 
@@ -1920,11 +1995,13 @@ class EBMModel(BaseEstimator):
 
         selector = gen_local_selector(data_dicts, is_classification=is_classifier(self))
 
-        term_scores = remove_last(self.term_scores_, self.bin_weights_)
-        for term_idx, feature_idxs in enumerate(self.term_features_):
-            term_scores[term_idx] = trim_tensor(
-                term_scores[term_idx], trim_low=[True] * len(feature_idxs)
+        term_scores = [
+            scores[slices]
+            for scores, slices in zip(
+                self.term_scores_,
+                make_graph_slices(self.term_features_, self.bin_weights_),
             )
+        ]
 
         internal_obj = {
             "overall": None,
@@ -1969,25 +2046,40 @@ class EBMModel(BaseEstimator):
         check_is_fitted(self, "has_fitted_")
 
         if importance_type == "avg_weight":
-            importances = np.empty(len(self.term_features_), np.float64)
-            for i in range(len(self.term_features_)):
-                if is_classifier(self):
-                    mean_abs_score = (
-                        0  # everything is useless if we're predicting 1 class
-                    )
-                    if 1 < len(self.classes_):
-                        mean_abs_score = np.abs(self.term_scores_[i])
-                        if 2 < len(self.classes_):
-                            mean_abs_score = np.average(mean_abs_score, axis=-1)
-                        mean_abs_score = np.average(
-                            mean_abs_score, weights=self.bin_weights_[i]
-                        )
-                else:
-                    mean_abs_score = np.abs(self.term_scores_[i])
-                    mean_abs_score = np.average(
-                        mean_abs_score, weights=self.bin_weights_[i]
-                    )
-                importances.itemset(i, mean_abs_score)
+            importances = np.zeros(len(self.term_features_), np.float64)
+            if len(importances) == 0 or (
+                is_classifier(self) and len(self.classes_) <= 1
+            ):
+                # everything is useless if we're predicting 1 class
+                return importances
+
+            mean_abs_scores = [np.abs(scores) for scores in self.term_scores_]
+            if is_classifier(self) and 2 < len(self.classes_):
+                mean_abs_scores = [
+                    np.average(scores, axis=-1) for scores in mean_abs_scores
+                ]
+
+            # weighted average of every term in a single reduction over the flattened
+            # terms instead of an np.average call per term. None weights average evenly
+            sizes = np.fromiter(
+                map(np.size, mean_abs_scores), np.intp, len(mean_abs_scores)
+            )
+            offsets = np.zeros(len(sizes), np.intp)
+            np.cumsum(sizes[:-1], out=offsets[1:])
+            flat_weights = np.concatenate(
+                [
+                    np.ones(scores.size, np.float64)
+                    if weights is None
+                    else weights.ravel()
+                    for scores, weights in zip(mean_abs_scores, self.bin_weights_)
+                ]
+            )
+            flat_scores = np.concatenate(
+                [scores.ravel() for scores in mean_abs_scores]
+            )
+            flat_scores *= flat_weights
+            np.add.reduceat(flat_scores, offsets, out=importances)
+            importances /= np.add.reduceat(flat_weights, offsets)
             return importances
         elif importance_type == "min_max":
             return np.array(
@@ -2048,7 +2140,10 @@ class EBMModel(BaseEstimator):
 
         weights = self.bin_weights_[feature_idx][1:-1]
 
-        # Fit isotonic regression weighted by training data bin counts
+        # Fit isotonic regression weighted by training data bin counts.
+        # monotonize is rarely called, so only pay for the import when it is
+        from sklearn.isotonic import IsotonicRegression
+
         ir = IsotonicRegression(out_of_bounds="clip", increasing=increasing)
         y = ir.fit_transform(x, y, sample_weight=weights)
 
@@ -2305,38 +2400,12 @@ class ExplainableBoostingClassifier(EBMModel, ClassifierMixin, ExplainerMixin):
         Returns:
             Probability estimate of sample for each class.
         """
-        check_is_fitted(self, "has_fitted_")
-
-        if init_score is None:
-            X, n_samples = preclean_X(X, self.feature_names_in_, self.feature_types_in_)
-        else:
-            init_score, X, n_samples = clean_init_score_and_X(
-                self.link_,
-                self.link_param_,
-                init_score,
-                X,
-                self.feature_names_in_,
-                self.feature_types_in_,
-            )
-
-        if len(self.classes_) == 1:
-            # if there is only one class then all probabilities are 100%
-            return np.full((n_samples, 1), 1.0, np.float64)
-
-        log_odds = ebm_decision_function(
-            X,
-            n_samples,
-            self.feature_names_in_,
-            self.feature_types_in_,
-            self.bins_,
-            self.intercept_,
-            self.term_scores_,
-            self.term_features_,
-            init_score,
+        # inv_link returns probabilities of 100% if there is only one class
+        log_odds = self.decision_function(X, init_score)
+        return inv_link(
+            self.link_, self.link_param_, log_odds, len(self.classes_), False
         )
 
-        return inv_link(self.link_, self.link_param_, log_odds, len(self.classes_))
-
     def predict(self, X, init_score=None):
         """Predicts on provided samples.
 
@@ -2348,38 +2417,12 @@ class ExplainableBoostingClassifier(EBMModel, ClassifierMixin, ExplainerMixin):
         Returns:
             Predicted class label per sample.
         """
-        check_is_fitted(self, "has_fitted_")
+        log_odds = self.decision_function(X, init_score)
 
-        if init_score is None:
-            X, n_samples = preclean_X(X, self.feature_names_in_, self.feature_types_in_)
-        else:
-            init_score, X, n_samples = clean_init_score_and_X(
-                self.link_,
-                self.link_param_,
-                init_score,
-                X,
-                self.feature_names_in_,
-                self.feature_types_in_,
-            )
-
-        # TODO: handle the 1 class case here
-
-        log_odds = ebm_decision_function(
-            X,
-            n_samples,
-            self.feature_names_in_,
-            self.feature_types_in_,
-            self.bins_,
-            self.intercept_,
-            self.term_scores_,
-            self.term_features_,
-            init_score,
-        )
-
-        # TODO: for binary classification we could just look for values greater than zero instead of expanding
         if log_odds.ndim == 1:
-            # Handle binary classification case -- softmax only works with 0s appended
-            log_odds = np.c_[np.zeros(log_odds.shape), log_odds]
+            # binary classification.  Same as argmax over [0, log_odds], so ties go to
+            # the negative class and NaN log odds go to the positive class
+            return self.classes_[np.where(log_odds <= 0.0, 0, 1)]
 
         return self.classes_[np.argmax(log_odds, axis=1)]
 
@@ -2396,19 +2439,7 @@ class ExplainableBoostingClassifier(EBMModel, ClassifierMixin, ExplainerMixin):
             Predictions and local explanations for each sample.
         """
 
-        check_is_fitted(self, "has_fitted_")
-
-        if init_score is None:
-            X, n_samples = preclean_X(X, self.feature_names_in_, self.feature_types_in_)
-        else:
-            init_score, X, n_samples = clean_init_score_and_X(
-                self.link_,
-                self.link_param_,
-                init_score,
-                X,
-                self.feature_names_in_,
-                self.feature_types_in_,
-            )
+        X, n_samples, init_score = self._clean_X_and_init_score(X, init_score)
 
         # TODO: handle the 1 class case here
 
@@ -2425,12 +2456,15 @@ class ExplainableBoostingClassifier(EBMModel, ClassifierMixin, ExplainerMixin):
         )
 
         if output == "probabilities":
-            result = inv_link(self.link_, self.link_param_, scores, len(self.classes_))
+            result = inv_link(
+                self.link_, self.link_param_, scores, len(self.classes_), False
+            )
         elif output == "labels":
-            # TODO: for binary classification we could just look for values greater than zero instead of expanding
             if scores.ndim == 1:
-                scores = np.c_[np.zeros(scores.shape), scores]
-            result = self.classes_[np.argmax(scores, axis=1)]
+                # binary classification.  The positive class wins when the log odds are above zero
+                result = self.classes_[(0.0 < scores).astype(np.intp)]
+            else:
+                result = self.classes_[np.argmax(scores, axis=1)]
         elif output == "logits":
             result = scores
         else:
@@ -2671,31 +2705,7 @@ class ExplainableBoostingRegressor(EBMModel, RegressorMixin, ExplainerMixin):
         Returns:
             Predicted class label per sample.
         """
-        check_is_fitted(self, "has_fitted_")
-
-        if init_score is None:
-            X, n_samples = preclean_X(X, self.feature_names_in_, self.feature_types_in_)
-        else:
-            init_score, X, n_samples = clean_init_score_and_X(
-                self.link_,
-                self.link_param_,
-                init_score,
-                X,
-                self.feature_names_in_,
-                self.feature_types_in_,
-            )
-
-        scores = ebm_decision_function(
-            X,
-            n_samples,
-            self.feature_names_in_,
-            self.feature_types_in_,
-            self.bins_,
-            self.intercept_,
-            self.term_scores_,
-            self.term_features_,
-            init_score,
-        )
+        scores = self.decision_function(X, init_score)
         return inv_link(self.link_, self.link_param_, scores, -1)
 
     def predict_and_contrib(self, X, init_score=None):
@@ -2710,19 +2720,7 @@ class ExplainableBoostingRegressor(EBMModel, RegressorMixin, ExplainerMixin):
             Predictions and local explanations for each sample.
         """
 
-        check_is_fitted(self, "has_fitted_")
-
-        if init_score is None:
-            X, n_samples = preclean_X(X, self.feature_names_in_, self.feature_types_in_)
-        else:
-            init_score, X, n_samples = clean_init_score_and_X(
-                self.link_,
-                self.link_param_,
-                init_score,
-                X,
-                self.feature_names_in_,
-                self.feature_types_in_,
-            )
+        X, n_samples, init_score = self._clean_X_and_init_score(X, init_score)
 
         scores, explanations = ebm_decision_function_and_explain(
             X,
@@ -2948,36 +2946,11 @@ class DPExplainableBoostingClassifier(EBMModel, ClassifierMixin, ExplainerMixin)
         Returns:
             Probability estimate of sample for each class.
         """
-        check_is_fitted(self, "has_fitted_")
-
-        if init_score is None:
-            X, n_samples = preclean_X(X, self.feature_names_in_, self.feature_types_in_)
-        else:
-            init_score, X, n_samples = clean_init_score_and_X(
-                self.link_,
-                self.link_param_,
-                init_score,
-                X,
-                self.feature_names_in_,
-                self.feature_types_in_,
-            )
-
-        if len(self.classes_) == 1:
-            # if there is only one class then all probabilities are 100%
-            return np.full((n_samples, 1), 1.0, np.float64)
-
-        log_odds = ebm_decision_function(
-            X,
-            n_samples,
-            self.feature_names_in_,
-            self.feature_types_in_,
-            self.bins_,
-            self.intercept_,
-            self.term_scores_,
-            self.term_features_,
-            init_score,
+        # inv_link returns probabilities of 100% if there is only one class
+        log_odds = self.decision_function(X, init_score)
+        return inv_link(
+            self.link_, self.link_param_, log_odds, len(self.classes_), False
         )
-        return inv_link(self.link_, self.link_param_, log_odds, len(self.classes_))
 
     def predict(self, X, init_score=None):
         """Predicts on provided samples.
@@ -2990,38 +2963,12 @@ class DPExplainableBoostingClassifier(EBMModel, ClassifierMixin, ExplainerMixin)
         Returns:
             Predicted class label per sample.
         """
-        check_is_fitted(self, "has_fitted_")
+        log_odds = self.decision_function(X, init_score)
 
-        if init_score is None:
-            X, n_samples = preclean_X(X, self.feature_names_in_, self.feature_types_in_)
-        else:
-            init_score, X, n_samples = clean_init_score_and_X(
-                self.link_,
-                self.link_param_,
-                init_score,
-                X,
-                self.feature_names_in_,
-                self.feature_types_in_,
-            )
-
-        # TODO: handle the 1 class case here
-
-        log_odds = ebm_decision_function(
-            X,
-            n_samples,
-            self.feature_names_in_,
-            self.feature_types_in_,
-            self.bins_,
-            self.intercept_,
-            self.term_scores_,
-            self.term_features_,
-            init_score,
-        )
-
-        # TODO: for binary classification we could just look for values greater than zero instead of expanding
         if log_odds.ndim == 1:
-            # Handle binary classification case -- softmax only works with 0s appended
-            log_odds = np.c_[np.zeros(log_odds.shape), log_odds]
+            # binary classification.  Same as argmax over [0, log_odds], so ties go to
+            # the negative class and NaN log odds go to the positive class
+            return self.classes_[np.where(log_odds <= 0.0, 0, 1)]
 
         return self.classes_[np.argmax(log_odds, axis=1)]
 
@@ -3252,30 +3199,5 @@ class DPExplainableBoostingRegressor(EBMModel, RegressorMixin, ExplainerMixin):
         Returns:
             Predicted class label per sample.
         """
-        check_is_fitted(self, "has_fitted_")
-
-        if init_score is None:
-            X, n_samples = preclean_X(X, self.feature_names_in_, self.feature_types_in_)
-        else:
-            init_score, X, n_samples = clean_init_score_and_X(
-                self.link_,
-                self.link_param_,
-                init_score,
-                X,
-                self.feature_names_in_,
-                self.feature_types_in_,
-            )
-
-        scores = ebm_decision_function(
-            X,
-            n_samples,
-            self.feature_names_in_,
-            self.feature_types_in_,
-            self.bins_,
-            self.intercept_,
-            self.term_scores_,
-            self.term_features_,
-            init_score,
-        )
-
+        scores = self.decision_function(X, init_score)
         return inv_link(self.link_, self.link_param_, scores, -1)
@@ -13,14 +13,14 @@ from ._utils import (
 
 import numpy as np
 import warnings
-from itertools import count, chain
+from itertools import count
 
 import logging
 
 _log = logging.getLogger(__name__)
 
 
-def _harmonize_tensor(
+def _plan_harmonize(
     new_feature_idxs,
     new_bounds,
     new_bins,
@@ -28,9 +28,9 @@ def _harmonize_tensor(
     old_bounds,
     old_bins,
     old_mapping,
-    old_tensor,
-    bin_evidence_weight,
 ):
+    # the plan only depends on the bins, so it is computed once per model and term
+    # and then applied to the bin weights and to each of the bagged score tensors
     # TODO: don't pass in new_bound and old_bounds.  We use the bounds to proportion
     # weights at the tail ends of the graphs, but the problem with that is that
     # you can have outliers that'll stretch the weight very thin.  If you have an
@@ -66,17 +66,6 @@ def _harmonize_tensor(
         old_feature_idxs[old_idx] = -1  # in case we have duplicate feature idxs
         axes.append(old_idx)
 
-    if bin_evidence_weight is not None:
-        bin_evidence_weight = bin_evidence_weight.transpose(tuple(axes))
-
-    n_multiclasses = 1
-    if len(axes) != old_tensor.ndim:
-        # multiclass. The last dimension always stays put
-        axes.append(len(axes))
-        n_multiclasses = old_tensor.shape[-1]
-
-    old_tensor = old_tensor.transpose(tuple(axes))
-
     mapping = []
     lookups = []
     percentages = []
@@ -90,14 +79,7 @@ def _harmonize_tensor(
         old_feature_mapping = mapping_levels[
             min(len(mapping_levels), len(old_feature_idxs)) - 1
         ]
-        if old_feature_mapping is None:
-            old_feature_mapping = list(
-                (x,)
-                for x in range(
-                    len(old_feature_bins)
-                    + (2 if isinstance(old_feature_bins, dict) else 3)
-                )
-            )
+        # None is the identity mapping where each old bin maps to itself
         mapping.append(old_feature_mapping)
 
         new_bin_levels = new_bins[feature_idx]
@@ -110,19 +92,11 @@ def _harmonize_tensor(
 
             old_reversed = dict()
             for category, bin_idx in old_feature_bins.items():
-                category_list = old_reversed.get(bin_idx)
-                if category_list is None:
-                    old_reversed[bin_idx] = [category]
-                else:
-                    category_list.append(category)
+                old_reversed.setdefault(bin_idx, []).append(category)
 
             new_reversed = dict()
             for category, bin_idx in new_feature_bins.items():
-                category_list = new_reversed.get(bin_idx)
-                if category_list is None:
-                    new_reversed[bin_idx] = [category]
-                else:
-                    category_list.append(category)
+                new_reversed.setdefault(bin_idx, []).append(category)
             new_reversed = sorted(new_reversed.items())
 
             lookup = [0]
@@ -145,60 +119,53 @@ def _harmonize_tensor(
         else:
             # continuous feature
 
-            lookup = list(
+            old_idxs = (
                 np.searchsorted(old_feature_bins, new_feature_bins, side="left") + 1
             )
-            lookup.append(len(old_feature_bins) + 1)
-
+            old_idxs = np.append(old_idxs, len(old_feature_bins) + 1)
+            lookup = list(old_idxs)
+
+            # TODO: if the bounds are nan OR out of bounds from the cuts, estimate them.
+            # If -inf or +inf, change them to min/max for float
+            new_edges = np.concatenate(
+                (
+                    new_bounds[feature_idx, :1],
+                    new_feature_bins,
+                    new_bounds[feature_idx, 1:],
+                )
+            )
+            old_edges = np.concatenate(
+                (
+                    old_bounds[feature_idx, :1],
+                    old_feature_bins,
+                    old_bounds[feature_idx, 1:],
+                )
+            )
+            new_lows = new_edges[:-1]
+            new_highs = new_edges[1:]
+            old_lows = old_edges[old_idxs - 1]
+            old_highs = old_edges[old_idxs]
+
+            # if there are bins in the area above where the old data extended, then
+            # we'll have zero contribution in the old data where these new bins are
+            # located
+            overlaps = ~((old_highs <= new_lows) | (new_highs <= old_lows))
+
+            # the new min can be lower than the old min at the lowest bin, and the new
+            # max can be higher than the old max at the highest bin.  In that case we
+            # know the old data had zero contribution between them, so clip to the old
+            # range before taking the proportion
+            new_lows = np.maximum(new_lows, old_lows)
+            new_highs = np.minimum(new_highs, old_highs)
             percentage = [1.0]
-            for new_idx_minus_one, old_idx in enumerate(lookup):
-                if new_idx_minus_one == 0:
-                    new_low = new_bounds[feature_idx, 0]
-                    # TODO: if nan OR out of bounds from the cuts, estimate it.
-                    # If -inf or +inf, change it to min/max for float
-                else:
-                    new_low = new_feature_bins[new_idx_minus_one - 1]
-
-                if len(new_feature_bins) <= new_idx_minus_one:
-                    new_high = new_bounds[feature_idx, 1]
-                    # TODO: if nan OR out of bounds from the cuts, estimate it.
-                    # If -inf or +inf, change it to min/max for float
-                else:
-                    new_high = new_feature_bins[new_idx_minus_one]
-
-                if old_idx == 1:
-                    old_low = old_bounds[feature_idx, 0]
-                    # TODO: if nan OR out of bounds from the cuts, estimate it.
-                    # If -inf or +inf, change it to min/max for float
-                else:
-                    old_low = old_feature_bins[old_idx - 2]
-
-                if len(old_feature_bins) < old_idx:
-                    old_high = old_bounds[feature_idx, 1]
-                    # TODO: if nan OR out of bounds from the cuts, estimate it.
-                    # If -inf or +inf, change it to min/max for float
-                else:
-                    old_high = old_feature_bins[old_idx - 1]
-
-                if old_high <= new_low or new_high <= old_low:
-                    # if there are bins in the area above where the old data extended, then
-                    # we'll have zero contribution in the old data where these new bins are
-                    # located
-                    percentage.append(0.0)
-                else:
-                    if new_low < old_low:
-                        # this can't happen except at the lowest bin where the new min can be
-                        # lower than the old min.  In that case we know the old data
-                        # had zero contribution between the new min to the old min.
-                        new_low = old_low
-
-                    if old_high < new_high:
-                        # this can't happen except at the lowest bin where the new max can be
-                        # higher than the old max.  In that case we know the old data
-                        # had zero contribution between the new max to the old max.
-                        new_high = old_high
-
-                    percentage.append((new_high - new_low) / (old_high - old_low))
+            percentage.extend(
+                np.divide(
+                    new_highs - new_lows,
+                    old_highs - old_lows,
+                    out=np.zeros(len(old_idxs), np.float64),
+                    where=overlaps,
+                ).tolist()
+            )
 
             percentage.append(1.0)
             lookup.insert(0, 0)
@@ -207,69 +174,143 @@ def _harmonize_tensor(
         lookups.append(lookup)
         percentages.append(percentage)
 
-    new_shape = tuple(len(lookup) for lookup in lookups)
-    n_cells = np.prod(new_shape)
-
-    if 1 < n_multiclasses:
-        # for multiclass we need to add another dimension for the logits of each class
-        new_shape += (n_multiclasses,)
-
-    lookups.reverse()
-    percentages.reverse()
-    mapping.reverse()
-
-    # now we need to inflate it
-    intermediate_shape = (n_cells, n_multiclasses) if 1 < n_multiclasses else n_cells
-    new_tensor = np.empty(intermediate_shape, np.float64)
-    for cell_idx in range(n_cells):
-        remainder = cell_idx
-        old_reversed_bin_idxs = []
-        frac = 1.0
-        for lookup, percentage in zip(lookups, percentages):
-            n_bins = len(lookup)
-            new_bin_idx = remainder % n_bins
-            remainder //= n_bins
-            old_reversed_bin_idxs.append(lookup[new_bin_idx])
-            frac *= percentage[new_bin_idx]
-
-        cell_map = [
-            map_bins[bin_idx]
-            for map_bins, bin_idx in zip(mapping, old_reversed_bin_idxs)
-        ]
-        n_cells2 = np.prod([len(x) for x in cell_map])
-        val = np.zeros(n_multiclasses, np.float64)
-        total_weight = 0.0
-        for cell2_idx in range(n_cells2):
-            remainder2 = cell2_idx
-            old_reversed_bin2_idxs = []
-            for lookup2 in cell_map:
-                n_bins2 = len(lookup2)
-                new_bin2_idx = remainder2 % n_bins2
-                remainder2 //= n_bins2
-                old_reversed_bin2_idxs.append(lookup2[new_bin2_idx])
-            update = old_tensor[tuple(reversed(old_reversed_bin2_idxs))]
-            if n_cells2 == 1:
-                # if there's just one cell, which is typical, don't
-                # incur the floating point loss in precision
-                val = update
+    # for each new bin along each axis, the list of old bins that it draws from.  Normally
+    # this is a single old bin, but the mapping can combine several old bins into one.
+    # With the identity mapping the new bin draws only from the old bin in the lookup
+    cell_maps = [
+        None if map_bins is None else [map_bins[bin_idx] for bin_idx in lookup]
+        for map_bins, lookup in zip(mapping, lookups)
+    ]
+    n_dimensions = len(cell_maps)
+
+    # the number of old cells that each new cell draws from, which can only differ
+    # from 1 along the axes that have a mapping
+    n_cells2 = None
+    first_idxs = []
+    for dimension_idx, (cell_map, lookup) in enumerate(zip(cell_maps, lookups)):
+        if cell_map is None:
+            first_idxs.append(np.array(lookup, np.intp))
+            continue
+        shape = [1] * n_dimensions
+        shape[dimension_idx] = len(cell_map)
+        counts = np.fromiter(map(len, cell_map), np.intp, len(cell_map)).reshape(shape)
+        n_cells2 = counts if n_cells2 is None else n_cells2 * counts
+        first_idxs.append(
+            np.array([bins[0] if len(bins) != 0 else 0 for bins in cell_map], np.intp)
+        )
+
+    # where the new cells draw from several old cells, the (new bin, old bin) pairs
+    # along each axis that sum the old cells together
+    combined = None
+    contraction_idxs = None
+    if n_cells2 is not None and (n_cells2 != 1).any():
+        combined = np.broadcast_to(n_cells2 != 1, tuple(map(len, lookups)))
+        contraction_idxs = []
+        for cell_map, lookup in zip(cell_maps, lookups):
+            if cell_map is None:
+                rows = list(range(len(lookup)))
+                cols = lookup
             else:
-                if bin_evidence_weight is not None:
-                    evidence_weight = bin_evidence_weight[
-                        tuple(reversed(old_reversed_bin2_idxs))
-                    ]
-                    update *= evidence_weight
-                    total_weight += evidence_weight
-                val += update
+                rows = [new_idx for new_idx, bins in enumerate(cell_map) for _ in bins]
+                cols = [old_idx for bins in cell_map for old_idx in bins]
+            contraction_idxs.append((rows, cols))
+
+    # the proportion of each old bin weight that goes into the new bins
+    frac = None
+    for dimension_idx in range(n_dimensions - 1, -1, -1):
+        shape = [1] * n_dimensions
+        shape[dimension_idx] = len(percentages[dimension_idx])
+        percentage = np.array(percentages[dimension_idx], np.float64).reshape(shape)
+        frac = percentage if frac is None else frac * percentage
+
+    # when the models agree on the bins, which is common, each new bin draws from the
+    # old bin at the same position and none of the weight is split.  If the old tensor
+    # also has the same shape then harmonizing it leaves it unchanged
+    is_identity = (
+        axes == list(range(n_dimensions))
+        and combined is None
+        and (frac == 1.0).all()
+        and all(
+            idxs[-1] == -1 and (idxs[:-1] == np.arange(len(idxs) - 1)).all()
+            for idxs in first_idxs
+        )
+    )
+
+    return axes, first_idxs, combined, contraction_idxs, frac, is_identity
+
+
+def _apply_harmonize(plan, old_tensor, bin_evidence_weight, is_bagged=False):
+    # when is_bagged is True the old_tensor holds all the bags stacked along a leading
+    # axis and we harmonize them all at once
+    axes, first_idxs, combined, contraction_idxs, frac, is_identity = plan
+    n_dimensions = len(axes)
+    n_leading = 1 if is_bagged else 0
+    leading = (slice(None),) * n_leading
+
+    if is_identity and all(
+        len(idxs) == n_bins
+        for idxs, n_bins in zip(first_idxs, old_tensor.shape[n_leading:])
+    ):
+        # nothing to harmonize, and the callers don't modify what we return
+        return old_tensor.astype(np.float64, copy=False)
+
+    if bin_evidence_weight is not None:
+        bin_evidence_weight = bin_evidence_weight.transpose(axes)
+
+    n_multiclasses = 1
+    if n_dimensions + n_leading != old_tensor.ndim:
+        # multiclass. The last dimension always stays put
+        axes = axes + [n_dimensions]
+        n_multiclasses = old_tensor.shape[-1]
+
+    old_tensor = old_tensor.transpose(
+        list(range(n_leading)) + [axis + n_leading for axis in axes]
+    )
+
+    # if there's just one old cell, which is typical, take its value directly so that we
+    # don't incur the floating point loss in precision
+    leading_idxs = [np.arange(old_tensor.shape[0])] if is_bagged else []
+    new_tensor = old_tensor[np.ix_(*leading_idxs, *first_idxs)].astype(
+        np.float64, copy=False
+    )
+
+    if contraction_idxs is not None:
+        # sum the old cells that make up each new cell with one contraction per axis
+        contractions = []
+        for dimension_idx, (rows, cols) in enumerate(contraction_idxs):
+            n_new_bins = new_tensor.shape[n_leading + dimension_idx]
+            n_old_bins = old_tensor.shape[n_leading + dimension_idx]
+            contraction = np.zeros((n_new_bins, n_old_bins), np.float64)
+            np.add.at(contraction, (rows, cols), 1.0)
+            contractions.append(contraction)
+
+        def contract(tensor, n_skip):
+            for dimension_idx, contraction in enumerate(contractions, n_skip):
+                tensor = np.tensordot(contraction, tensor, axes=([1], [dimension_idx]))
+                tensor = np.moveaxis(tensor, 0, dimension_idx)
+            return tensor
+
         if bin_evidence_weight is None:
             # we're doing a bin weight and NOT a score tensor
-            val *= frac
-        elif total_weight != 0.0:
+            sums = contract(old_tensor, n_leading)
+        else:
             # we're doing scores and we need to take a weighted average
-            # but if the total_weight is zero then val should be zero and
-            # our update should still be zero, which it already is
-            val = val / total_weight
-        new_tensor[cell_idx] = val
-    new_tensor = new_tensor.reshape(new_shape)
+            # but if the total_weight is zero then the sum is also zero
+            # and we leave it that way
+            evidence_weight = bin_evidence_weight
+            if 1 < n_multiclasses:
+                evidence_weight = evidence_weight[..., np.newaxis]
+            sums = contract(old_tensor * evidence_weight, n_leading)
+            total_weight = contract(bin_evidence_weight, 0)
+            if 1 < n_multiclasses:
+                total_weight = total_weight[..., np.newaxis]
+            sums = np.divide(sums, total_weight, out=sums, where=total_weight != 0.0)
+        new_tensor[leading + (combined,)] = sums[leading + (combined,)]
+
+    if bin_evidence_weight is None:
+        # we're doing a bin weight and NOT a score tensor
+        new_tensor = new_tensor * frac
+
     return new_tensor
 
 
@@ -401,16 +442,23 @@ def merge_ebms(models):
     # cuts reduces the number of estimates that we need to make and reduces the complexity of the
     # tensors, so it's good to have this reduction.
 
+    # look up the per-model attributes once instead of per feature and level
+    all_bins = [model.bins_ for model in models]
+    all_feature_types_in = [
+        getattr(model, "feature_types_in_", None) for model in models
+    ]
+
     new_feature_types = []
     new_bins = []
     for feature_idx in range(n_features):
-        bin_types = set(type(model.bins_[feature_idx][0]) for model in models)
+        models_bin_levels = [bins[feature_idx] for bins in all_bins]
+        bin_types = set(type(bin_levels[0]) for bin_levels in models_bin_levels)
+        is_categorical = len(bin_types) == 1 and next(iter(bin_types)) is dict
 
-        if len(bin_types) == 1 and next(iter(bin_types)) is dict:
+        if is_categorical:
             # categorical
             new_feature_type = None
-            for model in models:
-                feature_types_in = getattr(model, "feature_types_in_", None)
+            for feature_types_in in all_feature_types_in:
                 if feature_types_in is not None:
                     feature_type = feature_types_in[feature_idx]
                     if feature_type == "nominal":
@@ -426,22 +474,33 @@ def merge_ebms(models):
             new_feature_type = "continuous"
         new_feature_types.append(new_feature_type)
 
-        level_end = max(len(model.bins_[feature_idx]) for model in models)
+        # bin types are consistent across the levels within a model, so find the
+        # models that need their categoricals converted to continuous just once.
+        # levels often share the same bins, so convert each distinct one only once
+        converting_model_idxs = []
+        if 1 != len(bin_types):
+            converting_model_idxs = [
+                model_idx
+                for model_idx, bin_levels in enumerate(models_bin_levels)
+                if isinstance(bin_levels[0], dict)
+            ]
+        conversions = dict()
+
+        level_end = max(map(len, models_bin_levels))
         new_leveled_bins = []
         for level_idx in range(level_end):
             model_bins = []
-            for model_idx, model in enumerate(models):
-                bin_levels = model.bins_[feature_idx]
+            for model_idx, bin_levels in enumerate(models_bin_levels):
                 bin_level = bin_levels[min(level_idx, len(bin_levels) - 1)]
                 model_bins.append(bin_level)
 
                 old_mapping[model_idx][feature_idx].append(None)
                 old_bins[model_idx][feature_idx].append(bin_level)
 
-            if len(bin_types) == 1 and next(iter(bin_types)) is dict:
+            if is_categorical:
                 # categorical
                 merged_keys = sorted(
-                    set(chain.from_iterable(bin.keys() for bin in model_bins))
+                    {category for bin in model_bins for category in bin}
                 )
                 # TODO: for now we just support alphabetical ordering in merged models, but
                 # we could do all sort of special processing like trying to figure out if the original
@@ -463,29 +522,38 @@ def merge_ebms(models):
                     # float64 in their data, so there shouldn't be a lot of non-float values
                     # in the other models.
 
-                    for model_idx, bins_in_model in enumerate(model_bins):
-                        if isinstance(bins_in_model, dict):
-                            (
-                                converted_bins,
-                                mapping,
-                                converted_min,
-                                converted_max,
-                            ) = convert_categorical_to_continuous(bins_in_model)
-                            model_bins[model_idx] = converted_bins
-
-                            old_min = old_bounds[model_idx][feature_idx][0]
-                            if isnan(old_min) or converted_min < old_min:
-                                old_bounds[model_idx][feature_idx][0] = converted_min
-
-                            old_max = old_bounds[model_idx][feature_idx][1]
-                            if isnan(old_max) or old_max < converted_max:
-                                old_bounds[model_idx][feature_idx][1] = converted_max
-
-                            old_bins[model_idx][feature_idx][level_idx] = converted_bins
-                            old_mapping[model_idx][feature_idx][level_idx] = mapping
-
-                merged_bins = np.array(
-                    sorted(set(chain.from_iterable(model_bins))), np.float64
+                    for model_idx in converting_model_idxs:
+                        bins_in_model = model_bins[model_idx]
+                        conversion = conversions.get(id(bins_in_model))
+                        if conversion is None:
+                            conversion = convert_categorical_to_continuous(
+                                bins_in_model
+                            )
+                            conversions[id(bins_in_model)] = conversion
+                        (
+                            converted_bins,
+                            mapping,
+                            converted_min,
+                            converted_max,
+                        ) = conversion
+                        model_bins[model_idx] = converted_bins
+
+                        old_min = old_bounds[model_idx][feature_idx][0]
+                        if isnan(old_min) or converted_min < old_min:
+                            old_bounds[model_idx][feature_idx][0] = converted_min
+
+                        old_max = old_bounds[model_idx][feature_idx][1]
+                        if isnan(old_max) or old_max < converted_max:
+                            old_bounds[model_idx][feature_idx][1] = converted_max
+
+                        old_bins[model_idx][feature_idx][level_idx] = converted_bins
+                        old_mapping[model_idx][feature_idx][level_idx] = mapping
+
+                # sort and deduplicate the cuts of all the models in one go
+                merged_bins = np.unique(
+                    np.concatenate(
+                        [np.asarray(bins, np.float64) for bins in model_bins]
+                    )
                 )
             new_leveled_bins.append(merged_bins)
         new_bins.append(new_leveled_bins)
@@ -509,20 +577,17 @@ def merge_ebms(models):
     if any(feature_name is not None for feature_name in feature_names_merged):
         ebm.feature_names_in_ = feature_names_merged
 
-    min_feature_vals = [bounds[:, 0] for bounds in old_bounds if bounds is not None]
-    max_feature_vals = [bounds[:, 1] for bounds in old_bounds if bounds is not None]
-    if 0 < len(min_feature_vals):  # max_feature_vals has the same len
+    model_bounds = [bounds for bounds in old_bounds if bounds is not None]
+    if 0 < len(model_bounds):
+        # stack the (n_features, 2) bounds of each model and reduce across the models
+        model_bounds = np.stack(model_bounds)
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", category=RuntimeWarning)
 
-            min_feature_vals = np.nanmin(min_feature_vals, axis=0)
-            max_feature_vals = np.nanmax(max_feature_vals, axis=0)
-            if any(not isnan(val) for val in min_feature_vals) or any(
-                not isnan(val) for val in max_feature_vals
-            ):
-                ebm.feature_bounds_ = np.array(
-                    list(zip(min_feature_vals, max_feature_vals)), np.float64
-                )
+            min_feature_vals = np.nanmin(model_bounds[:, :, 0], axis=0)
+            max_feature_vals = np.nanmax(model_bounds[:, :, 1], axis=0)
+        if not (np.isnan(min_feature_vals).all() and np.isnan(max_feature_vals).all()):
+            ebm.feature_bounds_ = np.column_stack((min_feature_vals, max_feature_vals))
 
     if not is_dp:
         if all(
@@ -556,14 +621,21 @@ def merge_ebms(models):
 
     bag_weights = []
     model_weights = []
+    models_n_outer_bags = []
     for model in models:
-        avg_weight = np.average([tensor.sum() for tensor in model.bin_weights_])
+        n_terms = len(model.bin_weights_)
+        avg_weight = 0.0
+        if n_terms != 0:
+            avg_weight = np.fromiter(
+                (tensor.sum() for tensor in model.bin_weights_), np.float64, n_terms
+            ).mean()
         model_weights.append(avg_weight)
 
         n_outer_bags = -1
         if hasattr(model, "bagged_scores_"):
             if 0 < len(model.bagged_scores_):
                 n_outer_bags = len(model.bagged_scores_[0])
+        models_n_outer_bags.append(n_outer_bags)
 
         model_bag_weights = getattr(model, "bag_weights_", None)
         if model_bag_weights is None:
@@ -582,16 +654,17 @@ def merge_ebms(models):
     # of the ebm.bagged_scores_ attribute
     ebm.bag_weights_ = bag_weights
 
-    fg_dicts = []
-    all_fg = set()
-    for model in models:
-        fg_sorted = [
-            tuple(sorted(feature_idxs)) for feature_idxs in model.term_features_
-        ]
-        fg_dicts.append(dict(zip(fg_sorted, count())))
-        all_fg.update(fg_sorted)
+    # for each term across all the models, the index of the term within each model or
+    # None if the model does not have the term
+    fg_to_terms = dict()
+    for model_idx, model in enumerate(models):
+        for term_idx, feature_idxs in enumerate(model.term_features_):
+            term_idxs = fg_to_terms.setdefault(
+                tuple(sorted(feature_idxs)), [None] * len(models)
+            )
+            term_idxs[model_idx] = term_idx
 
-    sorted_fgs = order_terms(list(all_fg))
+    sorted_fgs = order_terms(list(fg_to_terms.keys()))
 
     # TODO: in the future we might at this point try and figure out the most
     #       common feature ordering within the feature groups.  Take the mode first
@@ -634,13 +707,20 @@ def merge_ebms(models):
         # use and then it would make something that is consistent across all of these disparate sources
         # of information.  Hopefully, the user hasn't edited the model in a way that creates no solution.
 
-        bin_weight_percentages = []
-        for model_idx, model, fg_dict, model_weight in zip(
-            count(), models, fg_dicts, model_weights
+        term_idxs = fg_to_terms[sorted_fg]
+
+        # harmonize the bin weights of each model once and use them both for the
+        # distribution estimate and as the model's new bin weights
+        plans = []
+        harmonized_bin_weights = []
+        bin_weight_percentages = None
+        for model_idx, model, term_idx, model_weight in zip(
+            count(), models, term_idxs, model_weights
         ):
-            term_idx = fg_dict.get(sorted_fg)
+            plan = None
+            fixed_tensor = None
             if term_idx is not None:
-                fixed_tensor = _harmonize_tensor(
+                plan = _plan_harmonize(
                     sorted_fg,
                     ebm.feature_bounds_,
                     ebm.bins_,
@@ -648,66 +728,70 @@ def merge_ebms(models):
                     old_bounds[model_idx],
                     old_bins[model_idx],
                     old_mapping[model_idx],
-                    model.bin_weights_[term_idx],
-                    None,
                 )
-                bin_weight_percentages.append(fixed_tensor * model_weight)
+                fixed_tensor = _apply_harmonize(
+                    plan, model.bin_weights_[term_idx], None
+                )
+                weighted_tensor = fixed_tensor * model_weight
+                if bin_weight_percentages is None:
+                    bin_weight_percentages = weighted_tensor
+                else:
+                    bin_weight_percentages += weighted_tensor
+            plans.append(plan)
+            harmonized_bin_weights.append(fixed_tensor)
 
         # use this when we don't have a feature group in a model as a reasonable
         # set of guesses for the distribution of the weight of the model
-        bin_weight_percentages = np.sum(bin_weight_percentages, axis=0)
-        bin_weight_percentages = bin_weight_percentages / bin_weight_percentages.sum()
+        bin_weight_percentages /= bin_weight_percentages.sum()
 
         additive_shape = bin_weight_percentages.shape
         if 2 < n_classes:
             additive_shape = tuple(list(additive_shape) + [n_classes])
 
-        new_bin_weights = []
-        new_bagged_scores = []
-        for model_idx, model, fg_dict, model_weight in zip(
-            count(), models, fg_dicts, model_weights
+        # accumulate the bin weights in place and write each bag straight into
+        # its slot of the merged bag stack
+        new_bin_weights = None
+        scaled_percentages = None
+        new_bagged_scores = np.empty((len(bag_weights),) + additive_shape, np.float64)
+        bag_start = 0
+        for model_idx, model, term_idx, model_weight, n_outer_bags in zip(
+            count(), models, term_idxs, model_weights, models_n_outer_bags
         ):
-            n_outer_bags = -1
-            if hasattr(model, "bagged_scores_"):
-                if 0 < len(model.bagged_scores_):
-                    n_outer_bags = len(model.bagged_scores_[0])
-
-            term_idx = fg_dict.get(sorted_fg)
+            n_outer_bags = max(n_outer_bags, 0)
             if term_idx is None:
-                new_bin_weights.append(model_weight * bin_weight_percentages)
-                new_bagged_scores.extend(
-                    n_outer_bags * [np.zeros(additive_shape, np.float64)]
-                )
+                if new_bin_weights is None:
+                    # the scaled percentages are a fresh array that we can own
+                    new_bin_weights = model_weight * bin_weight_percentages
+                else:
+                    # scale into the scratch buffer instead of a new temporary
+                    if scaled_percentages is None:
+                        scaled_percentages = np.empty_like(bin_weight_percentages)
+                    np.multiply(
+                        bin_weight_percentages, model_weight, out=scaled_percentages
+                    )
+                    new_bin_weights += scaled_percentages
+                new_bagged_scores[bag_start : bag_start + n_outer_bags] = 0.0
             else:
-                harmonized_bin_weights = _harmonize_tensor(
-                    sorted_fg,
-                    ebm.feature_bounds_,
-                    ebm.bins_,
-                    model.term_features_[term_idx],
-                    old_bounds[model_idx],
-                    old_bins[model_idx],
-                    old_mapping[model_idx],
-                    model.bin_weights_[term_idx],
-                    None,
-                )
-                new_bin_weights.append(harmonized_bin_weights)
-                for bag_idx in range(n_outer_bags):
-                    harmonized_bagged_scores = _harmonize_tensor(
-                        sorted_fg,
-                        ebm.feature_bounds_,
-                        ebm.bins_,
-                        model.term_features_[term_idx],
-                        old_bounds[model_idx],
-                        old_bins[model_idx],
-                        old_mapping[model_idx],
-                        model.bagged_scores_[term_idx][bag_idx],
-                        model.bin_weights_[
-                            term_idx
-                        ],  # we use these to weigh distribution of scores for mulple bins
+                model_bin_weights = harmonized_bin_weights[model_idx]
+                if new_bin_weights is None:
+                    new_bin_weights = model_bin_weights.copy()
+                else:
+                    new_bin_weights += model_bin_weights
+                if n_outer_bags != 0:
+                    # harmonize all the bags of the model together
+                    new_bagged_scores[bag_start : bag_start + n_outer_bags] = (
+                        _apply_harmonize(
+                            plans[model_idx],
+                            np.asarray(model.bagged_scores_[term_idx][:n_outer_bags]),
+                            model.bin_weights_[
+                                term_idx
+                            ],  # we use these to weigh distribution of scores for mulple bins
+                            True,
+                        )
                     )
-                    new_bagged_scores.append(harmonized_bagged_scores)
-        ebm.bin_weights_.append(np.sum(new_bin_weights, axis=0))
-        ebm.bagged_scores_.append(np.array(new_bagged_scores, np.float64))
+            bag_start += n_outer_bags
+        ebm.bin_weights_.append(new_bin_weights)
+        ebm.bagged_scores_.append(new_bagged_scores)
 
     (
         ebm.term_scores_,
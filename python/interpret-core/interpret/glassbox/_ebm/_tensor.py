@@ -115,33 +115,35 @@ def remove_last(tensors, term_bin_weights):
     return new_tensors
 
 
-def _zero_tensor(tensor, zero_low=None, zero_high=None):
-    entire_tensor = [slice(None) for _ in range(tensor.ndim)]
-    if zero_low is not None:
-        for dimension_idx, is_zero in enumerate(zero_low):
-            if is_zero:
-                dim_slices = entire_tensor.copy()
-                dim_slices[dimension_idx] = 0
-                tensor[tuple(dim_slices)] = 0
-    if zero_high is not None:
-        for dimension_idx, is_zero in enumerate(zero_high):
-            if is_zero:
+def make_graph_slices(term_features, term_bin_weights):
+    # the slices that remove_last followed by trim_tensor(trim_low=[True] * n_dimensions) apply to
+    # a term.  They only depend on the bin weights, so they can be computed once per term and then
+    # applied to the scores, standard deviations, and weights of that term
+    all_slices = []
+    for feature_idxs, weights in zip(term_features, term_bin_weights):
+        n_dimensions = len(feature_idxs)
+        higher = [False] * n_dimensions
+        if weights is not None:
+            entire_tensor = [slice(None)] * n_dimensions
+            for dimension_idx in range(n_dimensions):
                 dim_slices = entire_tensor.copy()
                 dim_slices[dimension_idx] = -1
-                tensor[tuple(dim_slices)] = 0
+                higher[dimension_idx] = np.sum(weights[tuple(dim_slices)]) == 0
+        all_slices.append(
+            tuple(slice(1, -1 if is_high else None) for is_high in higher)
+        )
+    return all_slices
 
 
 def restore_missing_value_zeros(tensor, weights):
-    n_dimensions = weights.ndim
-    entire_tensor = [slice(None)] * n_dimensions
-    lower = []
-    higher = []
-    for dimension_idx in range(n_dimensions):
-        dim_slices = entire_tensor.copy()
-        dim_slices[dimension_idx] = 0
-        total_sum = np.sum(weights[tuple(dim_slices)])
-        lower.append(True if total_sum == 0 else False)
-        dim_slices[dimension_idx] = -1
-        total_sum = np.sum(weights[tuple(dim_slices)])
-        higher.append(True if total_sum == 0 else False)
-    _zero_tensor(tensor, lower, higher)
+    # zero the missing (index 0) and unknown (index -1) faces of the tensor along each
+    # dimension where no weight was observed.  The faces are checked with views, so
+    # nothing is allocated beyond the index tuples
+    for dimension_idx in range(weights.ndim):
+        leading = (slice(None),) * dimension_idx
+        lower = leading + (0,)
+        higher = leading + (-1,)
+        if np.sum(weights[lower]) == 0:
+            tensor[lower] = 0
+        if np.sum(weights[higher]) == 0:
+            tensor[higher] = 0
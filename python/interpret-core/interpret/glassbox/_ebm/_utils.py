@@ -1,25 +1,28 @@
 # Copyright (c) 2023 The InterpretML Contributors
 # Distributed under the MIT software license
 
-from math import ceil, isnan, isinf, exp, log
+from math import ceil, isfinite, isnan, exp, log
 from ...utils._native import Native
 
 from ._tensor import restore_missing_value_zeros
 
 import numpy as np
 import warnings
-from itertools import islice
 
-from ._multiclass import multiclass_postprocess
 
 import logging
 
 _log = logging.getLogger(__name__)
 
 
-def _weighted_std(a, axis, weights):
-    average = np.average(a, axis, weights)
-    variance = np.average((a - average) ** 2, axis, weights)
+def _weighted_std(a, axis, weights, average=None):
+    if average is None:
+        average = np.average(a, axis, weights)
+    # keep the two-pass form since E[a^2] - E[a]^2 cancels badly when the bags agree
+    # closely, but square the deviations in place to avoid a second temporary
+    deviations = a - np.expand_dims(average, axis)
+    np.square(deviations, out=deviations)
+    variance = np.average(deviations, axis, weights)
     return np.sqrt(variance)
 
 
@@ -34,32 +37,39 @@ def convert_categorical_to_continuous(categories):
     # We can't convert a continuous feature that has cuts back into categoricals
     # since the categorical value could have been anything between the cuts that we know about.
 
-    clusters = dict()
-    non_float_idxs = set()
-
-    old_min = np.nan
-    old_max = np.nan
-    for category, idx in categories.items():
+    n_categories = len(categories)
+    idxs = np.fromiter(categories.values(), np.int64, n_categories)
+    vals = np.empty(n_categories, np.float64)
+    is_float = np.ones(n_categories, np.bool_)
+    for category_idx, category in enumerate(categories):
         try:
             # this strips leading and trailing spaces
-            val = float(category)
+            vals[category_idx] = float(category)
         except ValueError:
-            non_float_idxs.add(idx)
-            continue
+            vals[category_idx] = np.nan
+            is_float[category_idx] = False
 
-        if isnan(val) or isinf(val):
-            continue
+    finite = np.isfinite(vals)
+    vals = vals[finite]
+    float_idxs = idxs[finite]
 
-        if isnan(old_min) or val < old_min:
-            old_min = val
-        if isnan(old_max) or old_max < val:
-            old_max = val
-
-        cluster_list = clusters.get(idx)
-        if cluster_list is None:
-            clusters[idx] = [val]
-        else:
-            cluster_list.append(val)
+    old_min = np.nan
+    old_max = np.nan
+    if len(vals) != 0:
+        old_min = float(vals.min())
+        old_max = float(vals.max())
+
+    # group the float values by the bin index they map to, sorted by value within each
+    # group, so that the first and last item of each group are the cluster bounds
+    _, first_positions = np.unique(float_idxs, return_index=True)
+    order = np.lexsort((vals, float_idxs))
+    vals = vals[order]
+    float_idxs = float_idxs[order]
+    starts = np.flatnonzero(np.diff(float_idxs, prepend=-1))
+    ends = np.append(starts, len(float_idxs))[1:] - 1
+    cluster_idxs = float_idxs[starts].tolist()
+    cluster_lows = vals[starts]
+    cluster_highs = vals[ends]
 
     # there's a super fringe case where two category strings map to the same bin, but
     # one of them is a float and the other is a non-float.  Normally, we'd include the
@@ -70,61 +80,57 @@ def convert_categorical_to_continuous(categories):
     # so we take the simple route of putting all the weight into the float and none on the
     # non-float.  We still need to remove any indexes though that map to both a float
     # and a non-float, so this line handles that
-    non_float_idxs = [idx for idx in non_float_idxs if idx not in clusters]
+    non_float_idxs = np.setdiff1d(idxs[~is_float], cluster_idxs).tolist()
     non_float_idxs.append(max(categories.values()) + 1)
 
-    if len(clusters) <= 1:
+    if len(cluster_idxs) <= 1:
         return np.empty(0, np.float64)
 
-    cluster_bounds = []
-    for cluster_list in clusters.values():
-        cluster_list.sort()
-        cluster_bounds.append((cluster_list[0], cluster_list[-1]))
-
     # TODO: move everything below here into C++ to ensure cross language compatibility
 
-    cluster_bounds.sort()
-
-    cuts = []
-    cluster_iter = iter(cluster_bounds)
-    low = next(cluster_iter)[-1]
-    for cluster in cluster_iter:
-        high = cluster[0]
-        if low < high:
-            # if they are equal or if low is higher then we can't separate one cluster
-            # from another, so we keep joining them until we can get clean separations
-
-            half_diff = (high - low) / 2
-            if isinf(half_diff):
-                # first try to subtract then divide since that's more accurate but some float64
-                # values will fail eg (max_float - min_float == +inf) so we need to try
-                # a less accurate way of dividing first if we detect this.  Dividing
-                # first will always succeed, even with the most extreme possible values of
-                # max_float / 2 - min_float / 2
-                half_diff = high / 2 - low / 2
-
-            # floats have more precision the smaller they are,
-            # so use the smaller number as the anchor
-            if abs(low) <= abs(high):
-                mid = low + half_diff
-            else:
-                mid = high - half_diff
-
-            if mid <= low:
-                # this can happen with very small half_diffs that underflow the add/subtract operation
-                # if this happens the numbers must be very close together on the order of a float tick.
-                # We use lower bound inclusive for our cut discretization, so make the mid == high
-                mid = high
+    # sort the clusters by their low bound, then by their high bound
+    bound_order = np.lexsort((cluster_highs, cluster_lows))
+    sorted_lows = cluster_lows[bound_order]
+    sorted_highs = cluster_highs[bound_order]
+
+    # walking the clusters in order, the running low is the highest high bound seen so far
+    # and each cut goes between it and the next cluster's low bound.  If they are equal
+    # or if low is higher then we can't separate one cluster from another, so we keep
+    # joining them until we can get clean separations
+    lows = np.maximum.accumulate(sorted_highs)[:-1]
+    highs = sorted_lows[1:]
+    separable = lows < highs
+    lows = lows[separable]
+    highs = highs[separable]
+
+    with np.errstate(over="ignore"):
+        half_diffs = (highs - lows) / 2
+    overflowed = np.isinf(half_diffs)
+    # first try to subtract then divide since that's more accurate but some float64
+    # values will fail eg (max_float - min_float == +inf) so we need to try
+    # a less accurate way of dividing first if we detect this.  Dividing
+    # first will always succeed, even with the most extreme possible values of
+    # max_float / 2 - min_float / 2
+    half_diffs[overflowed] = highs[overflowed] / 2 - lows[overflowed] / 2
+
+    # floats have more precision the smaller they are,
+    # so use the smaller number as the anchor
+    cuts = np.where(
+        np.abs(lows) <= np.abs(highs), lows + half_diffs, highs - half_diffs
+    )
 
-            cuts.append(mid)
-        low = max(low, cluster[-1])
-    cuts = np.array(cuts, np.float64)
+    # this can happen with very small half_diffs that underflow the add/subtract operation
+    # if this happens the numbers must be very close together on the order of a float tick.
+    # We use lower bound inclusive for our cut discretization, so make the mid == high
+    underflowed = cuts <= lows
+    cuts[underflowed] = highs[underflowed]
 
     mapping = [[] for _ in range(len(cuts) + 3)]
-    for old_idx, cluster_list in clusters.items():
-        # all the items in a cluster should be binned into the same bins
-        new_idx = np.searchsorted(cuts, cluster_list[:1], side="right")[0] + 1
-        mapping[new_idx].append(old_idx)
+    # all the items in a cluster should be binned into the same bins.  Keep the clusters
+    # in the order that they first appear in the categories
+    new_idxs = np.searchsorted(cuts, cluster_lows, side="right") + 1
+    for cluster_pos in np.argsort(first_positions).tolist():
+        mapping[new_idxs[cluster_pos]].append(cluster_idxs[cluster_pos])
 
     mapping[0].append(0)
     mapping[-1] = non_float_idxs
@@ -146,41 +152,36 @@ def _create_proportional_tensor(axis_weights):
         weights / axis_sum for weights, axis_sum in zip(axis_weights, axis_sums)
     ]
 
-    shape = tuple(map(len, axis_percentages))
-    n_cells = np.prod(shape)
-    tensor = np.empty(n_cells, np.float64)
-
-    # the last index items are next together in flat memory layout
-    axis_percentages.reverse()
-
-    for cell_idx in range(n_cells):
-        remainder = cell_idx
-        frac = 1.0
-        for percentages in axis_percentages:
-            bin_idx = remainder % len(percentages)
-            remainder //= len(percentages)
-            frac *= percentages[bin_idx]
-        val = frac * total_weight
-        tensor.itemset(cell_idx, val)
-    return tensor.reshape(shape)
+    # broadcast the axis percentages into their outer product.  Multiply starting from the
+    # last axis, which is the order the per-cell products were previously accumulated in
+    n_dimensions = len(axis_percentages)
+    tensor = None
+    for dimension_idx in range(n_dimensions - 1, -1, -1):
+        percentages = axis_percentages[dimension_idx]
+        shape = [1] * n_dimensions
+        shape[dimension_idx] = len(percentages)
+        percentages = percentages.reshape(shape)
+        tensor = percentages if tensor is None else tensor * percentages
+    return tensor * total_weight
 
 
 def process_terms(n_classes, bagged_scores, bin_weights, bag_weights):
     term_scores = []
     standard_deviations = []
     new_bagged_scores = []
+    bag_weights = np.asarray(bag_weights, np.float64)
+    is_equal_bags = bag_weights.min() == bag_weights.max()
+    total_bag_weight = bag_weights.sum()
     for score_tensors, weights in zip(bagged_scores, bin_weights):
         # if the missing/unknown bin has zero weight then whatever number was generated via boosting is
         # effectively meaningless and can be ignored. Set the value to zero for interpretability reasons
-        tensor_bags = []
-        for tensor in score_tensors:
-            tensor_copy = tensor.copy()
-            if n_classes != 1:
-                restore_missing_value_zeros(tensor_copy, weights)
-            tensor_bags.append(tensor_copy)
-        score_tensors = np.array(
-            tensor_bags, np.float64
-        )  # replace it to get stddev of 0 for weight of 0
+        # stack the bags into a single new array and zero each bag in place so that
+        # we make one copy instead of a copy per bag followed by a copy when stacking
+        score_tensors = np.array(score_tensors, np.float64)
+        if n_classes != 1:
+            for tensor in score_tensors:
+                # replace it to get stddev of 0 for weight of 0
+                restore_missing_value_zeros(tensor, weights)
         new_bagged_scores.append(score_tensors)
 
         # TODO PK: shouldn't we be zero centering each score tensor first before taking the standard deviation
@@ -203,19 +204,25 @@ def process_terms(n_classes, bagged_scores, bin_weights, bag_weights):
         #      will now be non-zero, but if during merging we loose the information that they should have been
         #      zeroed our missing/unknown bins will already be set to the value that will yield a neutral response
 
-        if (bag_weights == bag_weights[0]).all():
+        if is_equal_bags:
             # if all the bags have the same total weight we can avoid some numeracy issues
             # by using a non-weighted standard deviation
-            feature_term_scores = np.average(score_tensors, axis=0)
+            feature_term_scores = score_tensors.mean(axis=0)
             term_scores.append(feature_term_scores)
             if n_classes == 1:
                 standard_deviations.append(
                     np.zeros(feature_term_scores.shape, np.float64)
                 )
             else:
-                standard_deviations.append(np.std(score_tensors, axis=0))
+                # same as np.std, but reusing the mean that we already have
+                deviations = score_tensors - feature_term_scores
+                np.square(deviations, out=deviations)
+                standard_deviations.append(np.sqrt(deviations.mean(axis=0)))
         else:
-            feature_term_scores = np.average(score_tensors, axis=0, weights=bag_weights)
+            # contract the bag axis directly instead of materializing the weighted
+            # copy of all the bags that np.average would make
+            feature_term_scores = np.tensordot(bag_weights, score_tensors, axes=1)
+            feature_term_scores /= total_bag_weight
             term_scores.append(feature_term_scores)
             if n_classes == 1:
                 standard_deviations.append(
@@ -223,7 +230,12 @@ def process_terms(n_classes, bagged_scores, bin_weights, bag_weights):
                 )
             else:
                 standard_deviations.append(
-                    _weighted_std(score_tensors, axis=0, weights=bag_weights)
+                    _weighted_std(
+                        score_tensors,
+                        axis=0,
+                        weights=bag_weights,
+                        average=feature_term_scores,
+                    )
                 )
 
     if n_classes == 1:
@@ -231,20 +243,41 @@ def process_terms(n_classes, bagged_scores, bin_weights, bag_weights):
     else:
         intercept = np.zeros(Native.get_count_scores_c(n_classes), np.float64)
 
-        if n_classes <= 2:
-            for scores, weights in zip(term_scores, bin_weights):
-                score_mean = np.average(scores, weights=weights)
-                scores -= score_mean
-
-                # Add mean center adjustment back to intercept
-                intercept += score_mean
-        else:
-            # Postprocess model graphs for multiclass
-            multiclass_postprocess(n_classes, term_scores, bin_weights, intercept)
-
-        for scores, weights in zip(term_scores, bin_weights):
-            # set these to zero again since zero-centering them causes the missing/unknown to shift away from zero
-            restore_missing_value_zeros(scores, weights)
+        if len(term_scores) != 0:
+            # TODO: for multiclass we use the simpler method of taking the mean of the class scores.
+            # The original intended algorithm from the paper is in the function
+            # multiclass_postprocess_RESTORE_THIS
+
+            # the weighted mean of every term and class in one pass over the flattened terms
+            # instead of calling np.average once per (often tiny) term tensor
+            n_scores = len(intercept)
+            sizes = np.fromiter(map(np.size, bin_weights), np.intp, len(bin_weights))
+            offsets = np.zeros(len(sizes), np.intp)
+            np.cumsum(sizes[:-1], out=offsets[1:])
+            flat_weights = np.concatenate([weights.ravel() for weights in bin_weights])
+            flat_scores = np.concatenate(
+                [scores.reshape(-1, n_scores) for scores in term_scores]
+            )
+            flat_scores *= flat_weights[:, np.newaxis]
+            total_weights = np.add.reduceat(flat_weights, offsets)
+            if n_scores == 1 and (total_weights == 0).any():
+                # same error that np.average raises for binary and regression.  Multiclass
+                # has always divided directly, so there a term without weight gets NaN
+                # scores along with numpy's RuntimeWarning
+                raise ZeroDivisionError("Weights sum to zero, can't be normalized")
+            score_means = np.add.reduceat(flat_scores, offsets, axis=0)
+            score_means /= total_weights[:, np.newaxis]
+
+            # center and restore the zeros in the same pass over the terms
+            for scores, weights, score_mean in zip(
+                term_scores, bin_weights, score_means
+            ):
+                scores -= score_mean if n_scores != 1 else score_mean[0]
+                # set these to zero again since zero-centering them causes the missing/unknown to shift away from zero
+                restore_missing_value_zeros(scores, weights)
+
+            # Add mean center adjustment back to intercept
+            intercept += score_means.sum(axis=0)
 
         if n_classes < 0:
             # scikit-learn uses a float for regression, and a numpy array with 1 element for binary classification
@@ -253,6 +286,28 @@ def process_terms(n_classes, bagged_scores, bin_weights, bag_weights):
     return term_scores, standard_deviations, intercept, new_bagged_scores
 
 
+def remove_duplicate_terms(term_features, exclude):
+    # returns the terms in their original order without the terms that are in exclude, and without
+    # terms that repeat an earlier term, even if the features are listed in a different order
+
+    lengths = np.fromiter(map(len, term_features), np.intp, len(term_features))
+    keep = []
+    for n_dimensions in np.unique(lengths).tolist():
+        term_idxs = np.flatnonzero(lengths == n_dimensions)
+        sorted_terms = np.array(
+            [term_features[term_idx] for term_idx in term_idxs.tolist()], np.int64
+        ).reshape(len(term_idxs), n_dimensions)
+        sorted_terms.sort(axis=1)
+        # return_index gives the first occurrence of each unique term
+        _, first_idxs = np.unique(sorted_terms, axis=0, return_index=True)
+        sorted_terms = sorted_terms.tolist()
+        for idx in first_idxs.tolist():
+            if tuple(sorted_terms[idx]) not in exclude:
+                keep.append(term_idxs[idx])
+    keep.sort()
+    return [term_features[term_idx] for term_idx in keep]
+
+
 def generate_term_names(feature_names, term_features):
     return [" & ".join(feature_names[i] for i in grp) for grp in term_features]
 
@@ -265,11 +320,21 @@ def generate_term_types(feature_types, term_features):
 
 
 def order_terms(term_features, *args):
-    keys = (
-        [len(feature_idxs)] + sorted(feature_idxs) for feature_idxs in term_features
-    )
-    sorted_items = sorted(zip(keys, term_features, *args))
-    ret = tuple(list(x) for x in islice(zip(*sorted_items), 1, None))
+    # order by the number of features, then by the sorted feature indexes, and then by
+    # the original feature order to break ties between permutations of the same features
+    n_terms = len(term_features)
+    max_dimensions = max(map(len, term_features), default=0)
+    keys = np.zeros((n_terms, 1 + 2 * max_dimensions), np.int64)
+    for term_idx, feature_idxs in enumerate(term_features):
+        n_dimensions = len(feature_idxs)
+        keys[term_idx, 0] = n_dimensions
+        keys[term_idx, 1 : 1 + n_dimensions] = sorted(feature_idxs)
+        keys[term_idx, 1 + max_dimensions : 1 + max_dimensions + n_dimensions] = (
+            feature_idxs
+        )
+    # np.lexsort uses the last key as the primary one
+    order = np.lexsort(keys.T[::-1]).tolist()
+    ret = tuple([items[idx] for idx in order] for items in (term_features, *args))
     # in Python if only 1 item exists then the item is returned and not a tuple
     return ret if 2 <= len(ret) else ret[0]
 
@@ -302,7 +367,9 @@ def deduplicate_bins(bins):
             if isinstance(feature_bins, dict):
                 key = frozenset(feature_bins.items())
             else:
-                key = tuple(feature_bins)
+                # the raw bytes of the cuts hash and compare in C without boxing a
+                # numpy scalar per cut like tuple(feature_bins) would
+                key = np.asarray(feature_bins, np.float64).tobytes()
             existing = uniques.get(key, None)
             if existing is None:
                 uniques[key] = feature_bins
@@ -326,12 +393,11 @@ def convert_to_intervals(cuts):  # pragma: no cover
 
     smaller = np.insert(cuts, 0, -np.inf)
     larger = np.append(cuts, np.inf)
-    intervals = list(zip(smaller, larger))
 
-    if any(x[1] <= x[0] for x in intervals):
+    if (larger <= smaller).any():
         raise Exception("cuts must contain increasing values")
 
-    return intervals
+    return list(zip(smaller, larger))
 
 
 def convert_to_cuts(intervals):  # pragma: no cover
@@ -348,15 +414,16 @@ def convert_to_cuts(intervals):  # pragma: no cover
         raise Exception("intervals must end with inf")
 
     cuts = [x[0] for x in intervals[1:]]
-    cuts_verify = [x[1] for x in intervals[:-1]]
+    cuts_array = np.array(cuts, np.float64)
+    cuts_verify = np.array([x[1] for x in intervals[:-1]], np.float64)
 
-    if np.isnan(cuts).any():
+    if np.isnan(cuts_array).any():
         raise Exception("intervals cannot contain NaN")
 
-    if any(x[0] != x[1] for x in zip(cuts, cuts_verify)):
+    if (cuts_array != cuts_verify).any():
         raise Exception("intervals must contain adjacent sections")
 
-    if any(higher <= lower for lower, higher in zip(cuts, cuts[1:])):
+    if (cuts_array[1:] <= cuts_array[:-1]).any():
         raise Exception("intervals must contain increasing sections")
 
     return cuts
@@ -387,7 +454,9 @@ def make_bag(y, test_size, rng, is_stratified):
 
         # Adapt test size if too small relative to number of classes
         if is_stratified:
-            n_classes = len(set(y))
+            # y holds the encoded class indexes, so count them in C instead of hashing
+            # every label into a Python set
+            n_classes = np.unique(y).size
             if n_test_samples < n_classes:  # pragma: no cover
                 warnings.warn(
                     "Too few samples per class, adapting test size to guarantee 1 sample per class."
@@ -406,29 +475,26 @@ def make_bag(y, test_size, rng, is_stratified):
         raise Exception("test_size must be a positive numeric value.")
 
 
-def jsonify_lists(vals):
-    if len(vals) != 0:
-        if type(vals[0]) is float:
-            for idx, val in enumerate(vals):
-                # JSON doesn't have NaN, or infinities, but javaScript has these, so use javaScript strings
-                if isnan(val):
-                    vals[idx] = "NaN"  # this is what JavaScript outputs for 0/0
-                elif val == np.inf:
-                    vals[idx] = "Infinity"  # this is what JavaScript outputs for 1/0
-                elif val == -np.inf:
-                    vals[idx] = "-Infinity"  # this is what JavaScript outputs for -1/0
-        else:
-            for nested in vals:
-                jsonify_lists(nested)
-    return vals  # we modify in place, but return it just for easy access
+def jsonify_array(vals):
+    # find the few non-finite values on the float array itself with one vectorized
+    # scan, then patch just those items in the nested lists that tolist() made
+    vals = np.asarray(vals, np.float64)
+    items = vals.tolist()
+    if vals.ndim == 0:
+        return jsonify_item(items)
+    for *outer_idxs, idx in np.argwhere(~np.isfinite(vals)).tolist():
+        nested = items
+        for outer_idx in outer_idxs:
+            nested = nested[outer_idx]
+        nested[idx] = jsonify_item(nested[idx])
+    return items
 
 
 def jsonify_item(val):
     # JSON doesn't have NaN, or infinities, but javaScript has these, so use javaScript strings
+    if isfinite(val):
+        return val  # the common case needs just the one check
     if isnan(val):
-        val = "NaN"  # this is what JavaScript outputs for 0/0
-    elif val == np.inf:
-        val = "Infinity"  # this is what JavaScript outputs for 1/0
-    elif val == -np.inf:
-        val = "-Infinity"  # this is what JavaScript outputs for -1/0
-    return val
+        return "NaN"  # this is what JavaScript outputs for 0/0
+    # this is what JavaScript outputs for 1/0 and -1/0
+    return "Infinity" if 0 < val else "-Infinity"
@@ -1,7 +1,7 @@
 # Copyright (c) 2023 The InterpretML Contributors
 # Distributed under the MIT software license
 
-from joblib import Parallel, delayed
+from joblib import Parallel, delayed, effective_n_jobs
 from abc import ABC, abstractmethod
 
 
@@ -12,11 +12,18 @@ class ComputeProvider(ABC):
 
 
 class JobLibProvider(ComputeProvider):
-    def __init__(self, n_jobs=-1):
+    def __init__(self, n_jobs=-1, backend=None):
         self.n_jobs = n_jobs
+        self.backend = backend
 
     def parallel(self, compute_fn, compute_args_iter):
-        results = Parallel(n_jobs=self.n_jobs)(
+        if effective_n_jobs(self.n_jobs) == 1 or (
+            isinstance(compute_args_iter, list) and len(compute_args_iter) <= 1
+        ):
+            # nothing can run concurrently, so skip the joblib backend setup and dispatch
+            return [compute_fn(*args) for args in compute_args_iter]
+
+        results = Parallel(n_jobs=self.n_jobs, backend=self.backend)(
             delayed(compute_fn)(*args) for args in compute_args_iter
         )
         return results
@@ -2,7 +2,7 @@
 # Distributed under the MIT software license
 
 from collections import Counter
-from itertools import count
+from itertools import count, repeat
 import numpy as np
 import numpy.ma as ma
 
@@ -415,11 +415,16 @@ def _densify_object_ndarray(X_col):
         # TODO: handle ints here too which need to be checked if they are larger than the safe int max value
 
         X_col = X_col.copy()
+
+        # types holds every type in X_col, so resolve the float check once per type and then
+        # use C level map calls per item instead of running a python generator over every item
+        float_types = frozenset(
+            one_type
+            for one_type in types
+            if one_type is float or issubclass(one_type, np.floating)
+        )
         places = np.fromiter(
-            (
-                val_type is float or issubclass(val_type, np.floating)
-                for val_type in map(type, X_col)
-            ),
+            map(float_types.__contains__, map(type, X_col.tolist())),
             np.bool_,
             count=len(X_col),
         )
@@ -433,6 +438,37 @@ def _densify_object_ndarray(X_col):
     return X_col.astype(np.unicode_)
 
 
+def _lookup_categories(vals, categories):
+    # called under: predict
+
+    # vectorized equivalent of [categories.get(val, -1) for val in vals]. We sort the category strings
+    # once and then binary search all the vals together instead of doing a python dict probe per val
+
+    if len(categories) == 0:
+        return np.full(len(vals), -1, np.int64)
+
+    if len(vals) * 4 <= len(categories):
+        # building the sorted key array below costs O(len(categories)) on every call.  When there are only
+        # a few distinct vals, which is always true when predicting a single sample, probing the dict
+        # directly is cheaper than materializing the whole categories dictionary
+        return np.fromiter(
+            map(categories.get, vals.tolist(), repeat(-1)),
+            np.int64,
+            count=len(vals),
+        )
+
+    keys = np.array(list(categories.keys()), np.unicode_)
+    idxs = np.fromiter(categories.values(), np.int64, count=len(categories))
+
+    order = np.argsort(keys, kind="stable")
+    keys = keys[order]
+    idxs = idxs[order]
+
+    positions = np.searchsorted(keys, vals)
+    np.minimum(positions, len(keys) - 1, out=positions)
+    return np.where(keys[positions] == vals, idxs[positions], -1)
+
+
 def _process_column_initial(X_col, nonmissings, processing, min_unique_continuous):
     # called under: fit
 
@@ -444,9 +480,11 @@ def _process_column_initial(X_col, nonmissings, processing, min_unique_continuou
     elif X_col.dtype.type is np.object_:
         X_col = _densify_object_ndarray(X_col)
 
-    uniques, indexes, counts = np.unique(X_col, return_inverse=True, return_counts=True)
+    uniques, indexes = np.unique(X_col, return_inverse=True)
 
-    if issubclass(uniques.dtype.type, np.floating):
+    # widening float types to np.float64 cannot merge distinct values, so the floats are already unique
+    is_unique_floats = issubclass(uniques.dtype.type, np.floating)
+    if is_unique_floats:
         floats = uniques.astype(np.float64, copy=False)
         uniques = floats.astype(np.unicode_)
     else:
@@ -460,10 +498,15 @@ def _process_column_initial(X_col, nonmissings, processing, min_unique_continuou
         except ValueError:
             floats = None
 
-    if min_unique_continuous is not None and floats is not None:
+    # there can never be more unique floats than unique strings, so skip the check if that is already too few
+    if (
+        min_unique_continuous is not None
+        and floats is not None
+        and min_unique_continuous <= len(uniques)
+    ):
         # floats can have more than one string representation, so run unique again to check if we have
         # min_unique_continuous unique float64s in binary representation
-        if min_unique_continuous <= len(np.unique(floats)):
+        if is_unique_floats or min_unique_continuous <= len(np.unique(floats)):
             floats = floats[indexes]  # expand from the unique floats to expanded floats
             if nonmissings is not None:
                 floats_tmp = np.full(len(nonmissings), np.nan, dtype=np.float64)
@@ -495,27 +538,23 @@ def _process_column_initial(X_col, nonmissings, processing, min_unique_continuou
     # by noisy prevalence then that would be ok.
 
     # TODO: add a callback function option here that allows the caller to sort, remove, combine
+    # the uniques are distinct, so sorting their positions gives a total order and we can build
+    # the mapping from the permutation directly instead of sorting tuples and probing a dict per unique
     if processing == "nominal_prevalence":
+        # counts are only needed here, and bincount on the inverse is cheaper than return_counts
+        counts = np.bincount(indexes, minlength=len(uniques))
         if floats is None:
-            categories = [(-item[0], item[1]) for item in zip(counts, uniques)]
+            order = np.lexsort((uniques, -counts))
         else:
-            categories = [
-                (-item[0], item[1], item[2]) for item in zip(counts, floats, uniques)
-            ]
-        categories.sort()
-        categories = [x[-1] for x in categories]
+            order = np.lexsort((uniques, floats, -counts))
     elif processing != "nominal_alphabetical" and floats is not None:
-        categories = [(item[0], item[1]) for item in zip(floats, uniques)]
-        categories.sort()
-        categories = [x[1] for x in categories]
+        order = np.lexsort((uniques, floats))
     else:
-        categories = uniques.tolist()
-        categories.sort()
+        order = np.argsort(uniques, kind="stable")
 
-    categories = dict(zip(categories, count(1)))
-    mapping = np.fromiter(
-        (categories[val] for val in uniques), np.int64, count=len(uniques)
-    )
+    categories = dict(zip(uniques[order].tolist(), count(1)))
+    mapping = np.empty(len(uniques), np.int64)
+    mapping[order] = np.arange(1, len(uniques) + 1, dtype=np.int64)
     encoded = mapping[indexes]
 
     if nonmissings is not None:
@@ -546,9 +585,7 @@ def _encode_categorical_existing(X_col, nonmissings, categories):
         uniques = uniques.astype(np.float64, copy=False)
     uniques = uniques.astype(np.unicode_, copy=False)
 
-    mapping = np.fromiter(
-        (categories.get(val, -1) for val in uniques), np.int64, count=len(uniques)
-    )
+    mapping = _lookup_categories(uniques, categories)
     encoded = mapping[indexes]
 
     if (mapping < 0).any():
@@ -654,11 +691,7 @@ def _encode_pandas_categorical_existing(X_col, pd_categories, categories):
     # TODO: add special case handling if there is only 1 sample to make that faster
     # if we have just 1 sample, we can avoid making the mapping below
 
-    mapping = np.fromiter(
-        (categories.get(val, -1) for val in pd_categories),
-        np.int64,
-        count=len(pd_categories),
-    )
+    mapping = _lookup_categories(pd_categories, categories)
 
     if len(mapping) <= len(categories):
         mapping_cmp = np.arange(1, len(mapping) + 1, dtype=np.int64)
@@ -1134,10 +1167,19 @@ def unify_columns(
         # For some reason numpy really sucks at transposing data and asfortranarray makes it slower, so let's do it ourselves.
         # Allocate an empty fortran array here in python and have C++ fill it.  Then we can keep all the
         # rest of the code below the same since it'll just be accessed internally more efficiently.
-        # if go_fast and X.flags.c_contiguous:
-        #    # called under: predict
-        #    # during predict we don't care as much about memory consumption, so speed it by transposing everything
-        #    X = np.asfortranarray(X)
+        if (
+            go_fast
+            and type(X) is np.ndarray
+            and X.flags.c_contiguous
+            and 8 < n_cols
+            and X.dtype.type is not np.object_
+        ):
+            # called under: predict
+            # during predict we don't care as much about memory consumption, so speed it by transposing everything
+            # once.  Every X[:, col_idx] below then becomes a contiguous view that we can scan sequentially and
+            # pass into C without making a strided copy of each column. Object columns get converted per column
+            # anyways, and masked arrays would lose their mask, so leave those alone.
+            X = np.ascontiguousarray(X.T).T
 
         for feature_idx, categories in requests:
             col_idx = feature_idx if col_map is None else col_map[feature_idx]
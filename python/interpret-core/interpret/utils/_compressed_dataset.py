@@ -41,6 +41,11 @@ def bin_native(
 
     n_weights = 0 if sample_weight is None else 1
 
+    # the native dataset has to be measured before it can be allocated and filled.  Rather than
+    # unifying and discretizing every column a second time for the fill, keep the binned columns from
+    # the measure pass in the smallest integer type that holds them.  With max_bins <= 256 that is one
+    # byte per value, or 1/8th the size of a float64 X
+    binned = []
     n_bytes = native.measure_dataset_header(len(requests), n_weights, 1)
     for (feature_idx, feature_bins), (_, X_col, _, bad) in zip(
         responses,
@@ -67,14 +72,21 @@ def bin_native(
             n_bins += 1
             X_col[bad != _none_ndarray] = n_bins - 1
 
+        is_missing = np.count_nonzero(X_col) != len(X_col)
+        is_unknown = bad is not None
+        is_nominal = feature_types_in[feature_idx] == "nominal"
+
         n_bytes += native.measure_feature(
             n_bins,
-            np.count_nonzero(X_col) != len(X_col),
-            bad is not None,
-            feature_types_in[feature_idx] == "nominal",
+            is_missing,
+            is_unknown,
+            is_nominal,
             X_col,
         )
 
+        X_col = X_col.astype(np.min_scalar_type(n_bins - 1), copy=False)
+        binned.append((n_bins, is_missing, is_unknown, is_nominal, X_col))
+
     if sample_weight is not None:
         n_bytes += native.measure_weight(sample_weight)
 
@@ -83,41 +95,23 @@ def bin_native(
     else:
         n_bytes += native.measure_regression_target(y)
 
-    dataset = np.empty(n_bytes, np.ubyte)  # joblib loky doesn't support RawArray
+    # EBMs boost the outer bags on joblib threads, so every bag reads this same object without any
+    # copying or pickling.  We don't need RawArray or SharedMemory for process based backends either
+    # (joblib loky doesn't support RawArray).  Keeping the dataset as a single flat np.ubyte ndarray
+    # lets joblib automatically memmap it into its shared temp folder once per Parallel call, so all
+    # the outer bag workers map the same physical copy.  Unlike SharedMemory, joblib also falls back
+    # to disk when /dev/shm is too small (common in containers)
+    dataset = np.empty(n_bytes, np.ubyte)
 
     native.fill_dataset_header(len(requests), n_weights, 1, dataset)
 
-    for (feature_idx, feature_bins), (_, X_col, _, bad) in zip(
-        responses,
-        unify_columns(X, requests, feature_names_in, feature_types_in, None, False),
-    ):
-        if n_samples != len(X_col):
-            msg = "The columns of X are mismatched in the number of of samples"
-            _log.error(msg)
-            raise ValueError(msg)
-
-        if not X_col.flags.c_contiguous:
-            # X_col could be a slice that has a stride.  We need contiguous for caling into C
-            X_col = X_col.copy()
-
-        if isinstance(feature_bins, dict):
-            # categorical feature
-            n_bins = 1 if len(feature_bins) == 0 else (max(feature_bins.values()) + 1)
-        else:
-            # continuous feature
-            X_col = native.discretize(X_col, feature_bins)
-            n_bins = len(feature_bins) + 2
-
-        if bad is not None:
-            n_bins += 1
-            X_col[bad != _none_ndarray] = n_bins - 1
-
+    for n_bins, is_missing, is_unknown, is_nominal, X_col in binned:
         native.fill_feature(
             n_bins,
-            np.count_nonzero(X_col) != len(X_col),
-            bad is not None,
-            feature_types_in[feature_idx] == "nominal",
-            X_col,
+            is_missing,
+            is_unknown,
+            is_nominal,
+            X_col.astype(np.int64),
             dataset,
         )
 
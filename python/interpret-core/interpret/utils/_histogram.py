@@ -11,6 +11,15 @@ from ._native import Native
 _log = logging.getLogger(__name__)
 
 
+def make_bounded_edges(min_val, cuts, max_val):
+    # equivalent to np.concatenate(([min_val], cuts, [max_val])) without the temporary arrays
+    edges = np.empty(len(cuts) + 2, np.float64)
+    edges[0] = min_val
+    edges[1:-1] = cuts
+    edges[-1] = max_val
+    return edges
+
+
 def _make_histogram_edges(min_feature_val, max_feature_val, histogram_weights):
     native = Native.get_native_singleton()
 
@@ -30,7 +39,7 @@ def _make_histogram_edges(min_feature_val, max_feature_val, histogram_weights):
             f"There are insufficient floating point values between min_feature_val={min_feature_val} to max_feature_val={max_feature_val} to make {n_cuts} cuts"
         )
 
-    return np.concatenate(([min_feature_val], cuts, [max_feature_val]))
+    return make_bounded_edges(min_feature_val, cuts, max_feature_val)
 
 
 def make_all_histogram_edges(feature_bounds, histogram_weights):
@@ -2,7 +2,7 @@
 # Distributed under the MIT software license
 
 import numpy as np
-from sklearn.utils.extmath import softmax  # type: ignore
+from scipy.special import expit
 
 
 def link(link_function, link_param, predictions):
@@ -21,16 +21,34 @@ def link(link_function, link_param, predictions):
         raise ValueError("Unsupported link function: {}".format(link_function))
 
 
-def inv_link(link_function, link_param, scores, n_classes):
+def inv_link(link_function, link_param, scores, n_classes, copy=True):
+    # callers that pass in temporary scores they do not use afterwards can set
+    # copy=False to let the multiclass softmax reuse the scores array
     if link_function == "logit":
         if n_classes == 1:
             # if there is only one class then all probabilities are 100%
             return np.full((len(scores), 1), 1.0, np.float64)
 
         if scores.ndim == 1:
-            # binary classification requires prepending a 0
-            scores = np.c_[np.zeros(scores.shape), scores]
-        return softmax(scores)
+            # binary classification.  The softmax of [0, log_odds] is the logistic function,
+            # so there is no need to build an (n_samples, 2) array with a column of zeros.
+            # Use expit on both columns instead of 1 - p to keep small probabilities exact
+            probabilities = np.empty((len(scores), 2), np.float64)
+            expit(scores, out=probabilities[:, 1])
+            np.negative(scores, out=probabilities[:, 0])
+            expit(probabilities[:, 0], out=probabilities[:, 0])
+            return probabilities
+
+        # numerically stable softmax
+        maxes = scores.max(axis=1)[:, np.newaxis]
+        if copy:
+            probabilities = scores - maxes
+        else:
+            probabilities = scores
+            probabilities -= maxes
+        np.exp(probabilities, out=probabilities)
+        probabilities /= probabilities.sum(axis=1)[:, np.newaxis]
+        return probabilities
     elif link_function == "identity":
         return scores
     elif link_function == "log":
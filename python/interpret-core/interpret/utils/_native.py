@@ -333,9 +333,9 @@ class Native:
 
         return low_graph_bound.value, high_graph_bound.value
 
-    def discretize(self, X_col, cuts):
-        # TODO: for speed and efficiency, we should instead accept in the bin_indexes array
-        bin_indexes = np.empty(X_col.shape[0], dtype=np.int64, order="C")
+    def discretize(self, X_col, cuts, bin_indexes=None):
+        if bin_indexes is None:
+            bin_indexes = np.empty(X_col.shape[0], dtype=np.int64, order="C")
         return_code = self._unsafe.Discretize(
             X_col.shape[0],
             Native._make_pointer(X_col, np.float64),
@@ -1725,11 +1725,15 @@ class InteractionDetector(AbstractContextManager):
 
         native = Native.get_native_singleton()
 
+        # keep a reference to the array until the call returns.  _make_pointer only returns the
+        # address, and a temporary could be freed and reused by another thread while native reads it
+        feature_idxs = np.array(feature_idxs, np.int64)
+
         strength = ct.c_double(0.0)
         return_code = native._unsafe.CalcInteractionStrength(
             self._interaction_handle,
             len(feature_idxs),
-            Native._make_pointer(np.array(feature_idxs, np.int64), np.int64),
+            Native._make_pointer(feature_idxs, np.int64),
             interaction_flags,
             max_cardinality,
             min_samples_leaf,
@@ -18,6 +18,7 @@ from ._clean_simple import clean_dimensions
 from ._seed import normalize_initial_seed, increment_seed
 
 from ._native import Native
+from ..provider import JobLibProvider
 from ._privacy import (
     validate_eps_delta,
     calc_classic_noise_multi,
@@ -71,6 +72,92 @@ def _cut_continuous(native, X_col, processing, binning, max_bins, min_samples_bi
     return cuts
 
 
+def _fit_column(
+    native,
+    X_col,
+    categories,
+    sample_weight,
+    feature_type_given,
+    binning,
+    max_bins,
+    min_samples_bin,
+):
+    # called under: fit
+
+    # this only reads its own column and the native calls release the GIL, so
+    # several of these can run at the same time on threads
+
+    if categories is None:
+        # continuous feature
+        cuts = _cut_continuous(
+            native,
+            X_col,
+            feature_type_given,
+            binning,
+            max_bins,
+            min_samples_bin,
+        )
+        bin_indexes = native.discretize(X_col, cuts)
+        feature_bin_weights = np.bincount(
+            bin_indexes, weights=sample_weight, minlength=len(cuts) + 3
+        )
+        feature_bin_weights = feature_bin_weights.astype(np.float64, copy=False)
+
+        n_cuts = native.get_histogram_cut_count(X_col)
+        histogram_cuts = native.cut_uniform(X_col, n_cuts)
+        # the bin weights are already counted, so overwrite the same index buffer
+        native.discretize(X_col, histogram_cuts, bin_indexes)
+        feature_histogram_weights = np.bincount(
+            bin_indexes,
+            weights=sample_weight,
+            minlength=len(histogram_cuts) + 3,
+        )
+        feature_histogram_weights = feature_histogram_weights.astype(
+            np.float64, copy=False
+        )
+
+        # np.unique sorts the non-missing values, so the min and max fall out
+        # of it for free instead of taking separate nanmin/nanmax passes
+        n_missing = len(X_col)
+        X_col = X_col[~np.isnan(X_col)]
+        n_missing = n_missing - len(X_col)
+        X_col = np.unique(X_col)
+
+        min_feature_val = np.nan
+        max_feature_val = np.nan
+        if len(X_col) != 0:
+            min_feature_val = X_col[0]
+            max_feature_val = X_col[-1]
+
+        return (
+            cuts,
+            feature_bin_weights,
+            feature_histogram_weights,
+            min_feature_val,
+            max_feature_val,
+            n_missing,
+            len(X_col),
+        )
+
+    # categorical feature
+    n_unique_indexes = 0 if len(categories) == 0 else max(categories.values())
+    feature_bin_weights = np.bincount(
+        X_col, weights=sample_weight, minlength=n_unique_indexes + 2
+    )
+    feature_bin_weights = feature_bin_weights.astype(np.float64, copy=False)
+
+    # for categoricals histograms and bin weights are the same
+    return (
+        categories,
+        feature_bin_weights,
+        feature_bin_weights,
+        np.nan,
+        np.nan,
+        len(X_col) - np.count_nonzero(X_col),
+        len(categories),
+    )
+
+
 class EBMPreprocessor(BaseEstimator, TransformerMixin):
     """Transformer that preprocesses data to be ready before EBM."""
 
@@ -87,6 +174,7 @@ class EBMPreprocessor(BaseEstimator, TransformerMixin):
         delta=None,
         composition=None,
         privacy_bounds=None,
+        n_jobs=1,
     ):
         """Initializes EBM preprocessor.
 
@@ -102,6 +190,7 @@ class EBMPreprocessor(BaseEstimator, TransformerMixin):
             delta: Privacy budget parameter. Only applicable when binning is "private".
             composition: Method of tracking noise aggregation. Must be one of 'classic' or 'gdp'.
             privacy_bounds: User specified min/max values for numeric features. Only applicable when binning is "private".
+            n_jobs: Number of threads used to bin features in parallel. None means 1 and negative integers are interpreted as following joblib's formula (n_cpus + 1 + n_jobs). Private binning is always sequential.
         """
         self.feature_names = feature_names
         self.feature_types = feature_types
@@ -114,6 +203,7 @@ class EBMPreprocessor(BaseEstimator, TransformerMixin):
         self.delta = delta
         self.composition = composition
         self.privacy_bounds = privacy_bounds
+        self.n_jobs = n_jobs
 
     def fit(self, X, y=None, sample_weight=None):
         """Fits transformer to provided samples.
@@ -178,9 +268,14 @@ class EBMPreprocessor(BaseEstimator, TransformerMixin):
         n_features = len(feature_names_in)
 
         noise_scale = None  # only applicable for private binning
+        sample_weight_total = None
         if self.binning == "private":
             validate_eps_delta(self.epsilon, self.delta)
-            max_weight = 1 if sample_weight is None else np.max(sample_weight)
+            # every column shares the same total, so sum the weights just once
+            sample_weight_total = (
+                n_samples if sample_weight is None else sample_weight.sum()
+            )
+            max_weight = 1 if sample_weight is None else sample_weight.max()
             if self.composition == "classic":
                 noise_scale = calc_classic_noise_multi(
                     total_queries=n_features,
@@ -214,43 +309,92 @@ class EBMPreprocessor(BaseEstimator, TransformerMixin):
         rng = native.create_rng(normalize_initial_seed(self.random_state))
         is_privacy_bounds_warning = False
         is_privacy_types_warning = False
-        for feature_idx, (feature_type_in, X_col, categories, bad) in enumerate(
-            unify_columns(
-                X,
-                zip(range(n_features), repeat(None)),
-                feature_names_in,
-                self.feature_types,
-                self.min_unique_continuous,
-                False,
-            )
-        ):
-            if n_samples != len(X_col):
-                msg = "The columns of X are mismatched in the number of of samples"
-                _log.error(msg)
-                raise ValueError(msg)
 
-            max_bins = self.max_bins  # TODO: in the future allow this to be per-feature
-            if max_bins < 3:
-                raise ValueError(
-                    f"max_bins was {max_bins}, but must be 3 or higher. One bin for missing, one bin for unknown, and one or more bins for the non-missing values."
+        max_bins = self.max_bins  # TODO: in the future allow this to be per-feature
+
+        def checked_columns():
+            for feature_idx, (feature_type_in, X_col, categories, bad) in enumerate(
+                unify_columns(
+                    X,
+                    zip(range(n_features), repeat(None)),
+                    feature_names_in,
+                    self.feature_types,
+                    self.min_unique_continuous,
+                    False,
                 )
+            ):
+                if n_samples != len(X_col):
+                    msg = "The columns of X are mismatched in the number of of samples"
+                    _log.error(msg)
+                    raise ValueError(msg)
 
-            if not X_col.flags.c_contiguous:
-                # X_col could be a slice that has a stride.  We need contiguous for caling into C
-                X_col = X_col.copy()
+                if max_bins < 3:
+                    raise ValueError(
+                        f"max_bins was {max_bins}, but must be 3 or higher. One bin for missing, one bin for unknown, and one or more bins for the non-missing values."
+                    )
+
+                if not X_col.flags.c_contiguous:
+                    # X_col could be a slice that has a stride.  We need contiguous for caling into C
+                    X_col = X_col.copy()
+
+                feature_types_in[feature_idx] = feature_type_in
+                feature_type_given = (
+                    None
+                    if self.feature_types is None
+                    else self.feature_types[feature_idx]
+                )
 
-            feature_types_in[feature_idx] = feature_type_in
-            feature_type_given = (
-                None if self.feature_types is None else self.feature_types[feature_idx]
-            )
-            if categories is None:
-                # continuous feature
                 if bad is not None:
-                    msg = f"Feature {feature_names_in[feature_idx]} is indicated as continuous, but has non-numeric data"
+                    if categories is None:
+                        msg = f"Feature {feature_names_in[feature_idx]} is indicated as continuous, but has non-numeric data"
+                    else:
+                        msg = f"Feature {feature_names_in[feature_idx]} has unrecognized ordinal values"
                     _log.error(msg)
                     raise ValueError(msg)
 
-                if self.binning == "private":
+                yield feature_idx, X_col, categories, feature_type_given
+
+        if self.binning != "private":
+            # the native calls release the GIL, so threads bin the columns in parallel.
+            # joblib pulls the columns from the generator a few at a time, which limits
+            # how many contiguous column copies are alive at once
+            provider = JobLibProvider(n_jobs=self.n_jobs, backend="threading")
+            results = provider.parallel(
+                _fit_column,
+                (
+                    (
+                        native,
+                        X_col,
+                        categories,
+                        sample_weight,
+                        feature_type_given,
+                        self.binning,
+                        max_bins,
+                        self.min_samples_bin,
+                    )
+                    for _, X_col, categories, feature_type_given in checked_columns()
+                ),
+            )
+            for feature_idx, result in enumerate(results):
+                (
+                    bins[feature_idx],
+                    bin_weights[feature_idx],
+                    histogram_weights[feature_idx],
+                    min_feature_val,
+                    max_feature_val,
+                    n_missing,
+                    n_unique,
+                ) = result
+                feature_bounds.itemset((feature_idx, 0), min_feature_val)
+                feature_bounds.itemset((feature_idx, 1), max_feature_val)
+                missing_val_counts.itemset(feature_idx, n_missing)
+                unique_val_counts.itemset(feature_idx, n_unique)
+
+        else:
+            # private binning draws from the shared rng, so it has to stay sequential
+            for feature_idx, X_col, categories, feature_type_given in checked_columns():
+                if categories is None:
+                    # continuous feature
                     if np.isnan(X_col).any():
                         msg = "missing values in X not supported for private binning"
                         _log.error(msg)
@@ -296,59 +440,16 @@ class EBMPreprocessor(BaseEstimator, TransformerMixin):
                         min_feature_val,
                         max_feature_val,
                         rng,
+                        sample_weight_total,
                     )
                     feature_bin_weights.append(0)
                     feature_bin_weights = np.array(feature_bin_weights, np.float64)
-                else:
-                    min_feature_val = np.nanmin(X_col)
-                    max_feature_val = np.nanmax(X_col)
-                    cuts = _cut_continuous(
-                        native,
-                        X_col,
-                        feature_type_given,
-                        self.binning,
-                        max_bins,
-                        self.min_samples_bin,
-                    )
-                    bin_indexes = native.discretize(X_col, cuts)
-                    feature_bin_weights = np.bincount(
-                        bin_indexes, weights=sample_weight, minlength=len(cuts) + 3
-                    )
-                    feature_bin_weights = feature_bin_weights.astype(
-                        np.float64, copy=False
-                    )
 
-                    n_cuts = native.get_histogram_cut_count(X_col)
-                    histogram_cuts = native.cut_uniform(X_col, n_cuts)
-                    bin_indexes = native.discretize(X_col, histogram_cuts)
-                    feature_histogram_weights = np.bincount(
-                        bin_indexes,
-                        weights=sample_weight,
-                        minlength=len(histogram_cuts) + 3,
-                    )
-                    feature_histogram_weights = feature_histogram_weights.astype(
-                        np.float64, copy=False
-                    )
-
-                    histogram_weights[feature_idx] = feature_histogram_weights
-
-                    n_missing = len(X_col)
-                    X_col = X_col[~np.isnan(X_col)]
-                    n_missing = n_missing - len(X_col)
-                    missing_val_counts.itemset(feature_idx, n_missing)
-                    unique_val_counts.itemset(feature_idx, len(np.unique(X_col)))
-
-                bins[feature_idx] = cuts
-                feature_bounds.itemset((feature_idx, 0), min_feature_val)
-                feature_bounds.itemset((feature_idx, 1), max_feature_val)
-            else:
-                # categorical feature
-                if bad is not None:
-                    msg = f"Feature {feature_names_in[feature_idx]} has unrecognized ordinal values"
-                    _log.error(msg)
-                    raise ValueError(msg)
-
-                if self.binning == "private":
+                    bins[feature_idx] = cuts
+                    feature_bounds.itemset((feature_idx, 0), min_feature_val)
+                    feature_bounds.itemset((feature_idx, 1), max_feature_val)
+                else:
+                    # categorical feature
                     if np.count_nonzero(X_col) != len(X_col):
                         msg = "missing values in X not supported for private binning"
                         _log.error(msg)
@@ -358,17 +459,20 @@ class EBMPreprocessor(BaseEstimator, TransformerMixin):
                         # if auto-detected then we need to show a privacy warning
                         is_privacy_types_warning = True
 
-                    # TODO: clean up this hack that uses strings of the indexes
-                    keep_bins, old_feature_bin_weights = private_categorical_binning(
-                        X_col, sample_weight, noise_scale, max_bins - 1, rng
+                    (
+                        keep_bins,
+                        old_feature_bin_weights,
+                        unknown_weight,
+                    ) = private_categorical_binning(
+                        X_col,
+                        sample_weight,
+                        noise_scale,
+                        max_bins - 1,
+                        rng,
+                        sample_weight_total,
                     )
-                    unknown_weight = 0
-                    if keep_bins[-1] == "DPOther":
-                        unknown_weight = old_feature_bin_weights[-1]
-                        keep_bins = keep_bins[:-1]
-                        old_feature_bin_weights = old_feature_bin_weights[:-1]
 
-                    keep_bins = keep_bins.astype(np.int64)
+                    keep_bins = keep_bins.astype(np.int64, copy=False)
                     keep_bins = dict(zip(keep_bins, old_feature_bin_weights))
 
                     feature_bin_weights = np.empty(len(keep_bins) + 2, np.float64)
@@ -389,26 +493,8 @@ class EBMPreprocessor(BaseEstimator, TransformerMixin):
                             new_idx += 1
 
                     categories = new_categories
-                else:
-                    n_unique_indexes = (
-                        0 if len(categories) == 0 else max(categories.values())
-                    )
-                    feature_bin_weights = np.bincount(
-                        X_col, weights=sample_weight, minlength=n_unique_indexes + 2
-                    )
-                    feature_bin_weights = feature_bin_weights.astype(
-                        np.float64, copy=False
-                    )
-
-                    # for categoricals histograms and bin weights are the same
-                    histogram_weights[feature_idx] = feature_bin_weights
-
-                    missing_val_counts.itemset(
-                        feature_idx, len(X_col) - np.count_nonzero(X_col)
-                    )
-                    unique_val_counts.itemset(feature_idx, len(categories))
-                bins[feature_idx] = categories
-            bin_weights[feature_idx] = feature_bin_weights
+                    bins[feature_idx] = categories
+                bin_weights[feature_idx] = feature_bin_weights
 
         if is_privacy_bounds_warning:
             warn(
@@ -460,7 +546,7 @@ class EBMPreprocessor(BaseEstimator, TransformerMixin):
             )
             requests = zip(count(), category_iter)
             cols = unify_columns(
-                X, requests, self.feature_names_in_, self.feature_types_in_, None, False
+                X, requests, self.feature_names_in_, self.feature_types_in_, None, True
             )
             for feature_idx, bins, (_, X_col, _, _) in zip(count(), self.bins_, cols):
                 if n_samples != len(X_col):
@@ -475,9 +561,11 @@ class EBMPreprocessor(BaseEstimator, TransformerMixin):
                         # X_col could be a slice that has a stride.  We need contiguous for caling into C
                         X_col = X_col.copy()
 
-                    X_col = native.discretize(X_col, bins)
-
-                X_binned[:, feature_idx] = X_col
+                    # X_binned is column-major, so each column is a contiguous int64 buffer
+                    # that the native code can write into directly without a temporary
+                    native.discretize(X_col, bins, X_binned[:, feature_idx])
+                else:
+                    X_binned[:, feature_idx] = X_col
 
         return X_binned
 
@@ -532,6 +620,7 @@ def construct_bins(
     delta=None,
     composition=None,
     privacy_bounds=None,
+    n_jobs=1,
 ):
     is_mains = True
     for max_bins in max_bins_leveled:
@@ -547,6 +636,7 @@ def construct_bins(
             delta,
             composition,
             privacy_bounds,
+            n_jobs,
         )
 
         random_state = increment_seed(random_state)
@@ -1,6 +1,8 @@
 # Copyright (c) 2023 The InterpretML Contributors
 # Distributed under the MIT software license
 
+from functools import lru_cache
+
 import numpy as np
 from scipy.stats import norm
 from scipy.optimize import brentq
@@ -35,13 +37,20 @@ def delta_eps_mu(eps, mu):
     return norm.cdf(-eps / mu + mu / 2) - np.exp(eps) * norm.cdf(-eps / mu - mu / 2)
 
 
-def calc_gdp_noise_multi(total_queries, target_epsilon, delta):
-    """GDP analysis following Algorithm 2 in: https://arxiv.org/abs/2106.09680."""
-
+@lru_cache(maxsize=256)
+def _solve_mu(target_epsilon, delta):
+    # the root only depends on the privacy budget, so cache it across the calls that
+    # differ only in the number of queries
     def f(mu, eps, delta):
         return delta_eps_mu(eps, mu) - delta
 
-    final_mu = brentq(lambda x: f(x, target_epsilon, delta), 1e-5, 1000)
+    return brentq(lambda x: f(x, target_epsilon, delta), 1e-5, 1000)
+
+
+def calc_gdp_noise_multi(total_queries, target_epsilon, delta):
+    """GDP analysis following Algorithm 2 in: https://arxiv.org/abs/2106.09680."""
+
+    final_mu = _solve_mu(target_epsilon, delta)
     sigma = np.sqrt(total_queries) / final_mu
     return sigma
 
@@ -54,6 +63,7 @@ def private_numeric_binning(
     min_feature_val,
     max_feature_val,
     rng=None,
+    sample_weight_total=None,
 ):
     native = Native.get_native_singleton()
     uniform_weights, uniform_edges = np.histogram(
@@ -62,27 +72,43 @@ def private_numeric_binning(
         range=(min_feature_val, max_feature_val),
         weights=sample_weight,
     )
-    noisy_weights = uniform_weights + native.generate_gaussian_random(
-        rng=rng, stddev=noise_scale, count=uniform_weights.shape[0]
-    )
+    # without sample_weight the histogram counts are integers.  After that we own the
+    # weights so add the noise and clip in place instead of making temporaries
+    noisy_weights = uniform_weights.astype(np.float64, copy=False)
+    if noise_scale != 0:
+        # adding zero noise is a no-op, so don't ask the native code for it
+        noisy_weights += native.generate_gaussian_random(
+            rng=rng, stddev=noise_scale, count=uniform_weights.shape[0]
+        )
 
     # Postprocess to ensure realistic bin values (min=0)
-    noisy_weights = np.clip(noisy_weights, 0, None)
+    np.clip(noisy_weights, 0, None, out=noisy_weights)
 
     # TODO PK: check with Harsha, but we can probably alternate the taking of nibbles from both ends
     # so that the larger leftover bin tends to be in the center rather than on the right.
 
     # Greedily collapse bins until they meet or exceed target_weight threshold
-    sample_weight_total = len(X_col) if sample_weight is None else np.sum(sample_weight)
+    if sample_weight_total is None:
+        # callers binning several columns can pass this in to avoid resumming
+        sample_weight_total = (
+            len(X_col) if sample_weight is None else np.sum(sample_weight)
+        )
     target_weight = sample_weight_total / max_bins
+    # the weights are non-negative, so the running sum from the start of each bin is
+    # sorted and searchsorted finds where it first meets the threshold.  Restarting the
+    # cumsum at each bin keeps the sums identical to accumulating them one at a time
     bin_weights, bin_cuts = [0], [uniform_edges[0]]
     curr_weight = 0
-    for index, right_edge in enumerate(uniform_edges[1:]):
-        curr_weight += noisy_weights[index]
-        if curr_weight >= target_weight:
-            bin_cuts.append(right_edge)
-            bin_weights.append(curr_weight)
-            curr_weight = 0
+    start = 0
+    while start < noisy_weights.size:
+        cum_weights = np.cumsum(noisy_weights[start:])
+        index = int(np.searchsorted(cum_weights, target_weight, side="left"))
+        if index == cum_weights.size:
+            curr_weight = cum_weights[-1]
+            break
+        start += index + 1
+        bin_cuts.append(uniform_edges[start])
+        bin_weights.append(cum_weights[index])
 
     if len(bin_weights) == 1:
         # since we're adding unbounded random noise, it's possible that the total weight is less than the
@@ -101,50 +127,87 @@ def private_numeric_binning(
     return bin_cuts, bin_weights
 
 
-def private_categorical_binning(X_col, sample_weight, noise_scale, max_bins, rng=None):
+def private_categorical_binning(
+    X_col, sample_weight, noise_scale, max_bins, rng=None, sample_weight_total=None
+):
+    # returns the kept categories, their weights, and the weight of the small bins
+    # that were collapsed together (zero if there were none).  Integer columns get
+    # their integer categories back instead of strings
     native = Native.get_native_singleton()
-    # Initialize estimate
-    X_col = X_col.astype("U")
-    uniq_vals, uniq_idxs = np.unique(X_col, return_inverse=True)
-    weights = np.bincount(uniq_idxs, weights=sample_weight, minlength=len(uniq_vals))
-
-    weights = weights + native.generate_gaussian_random(
-        rng=rng, stddev=noise_scale, count=weights.shape[0]
-    )
+    # Initialize estimate.  Without sample_weight np.unique can count the categories
+    # while it finds them, so we don't need the inverse indexes
+    if X_col.dtype.kind in "iub":
+        # sorting the integers is much faster than sorting their strings.  Distinct
+        # integers have distinct strings, so we only need to sort the few unique
+        # strings to get the same order that sorting the whole string column would.
+        # floats are excluded since -0.0 and 0.0 are equal but have different strings
+        if sample_weight is None:
+            uniq_ints, weights = np.unique(X_col, return_counts=True)
+        else:
+            uniq_ints, int_idxs = np.unique(X_col, return_inverse=True)
+            weights = np.bincount(
+                int_idxs.ravel(), weights=sample_weight, minlength=len(uniq_ints)
+            )
+        order = np.argsort(uniq_ints.astype("U"))
+        uniq_vals = uniq_ints[order]
+        weights = weights[order]
+    else:
+        # columns that are already strings don't need another copy
+        X_col = X_col.astype("U", copy=False)
+        if sample_weight is None:
+            uniq_vals, weights = np.unique(X_col, return_counts=True)
+        else:
+            uniq_vals, uniq_idxs = np.unique(X_col, return_inverse=True)
+            weights = np.bincount(
+                uniq_idxs, weights=sample_weight, minlength=len(uniq_vals)
+            )
+
+    # without sample_weight the counts are integers.  After that we own the weights
+    # so add the noise and clip in place instead of making temporaries
+    weights = weights.astype(np.float64, copy=False)
+    if noise_scale != 0:
+        # adding zero noise is a no-op, so don't ask the native code for it
+        weights += native.generate_gaussian_random(
+            rng=rng, stddev=noise_scale, count=weights.shape[0]
+        )
 
     # Postprocess to ensure realistic bin values (min=0)
-    weights = np.clip(weights, 0, None)
+    np.clip(weights, 0, None, out=weights)
 
     # Collapse bins until target_weight is achieved.
-    sample_weight_total = len(X_col) if sample_weight is None else np.sum(sample_weight)
+    if sample_weight_total is None:
+        # callers binning several columns can pass this in to avoid resumming
+        sample_weight_total = (
+            len(X_col) if sample_weight is None else np.sum(sample_weight)
+        )
     target_weight = sample_weight_total / max_bins
-    small_bins = np.where(weights < target_weight)[0]
-    if len(small_bins) > 0:
-        other_weight = np.sum(weights[small_bins])
-        mask = np.ones(weights.shape, dtype=bool)
-        mask[small_bins] = False
-
-        # Collapse all small bins into "DPOther"
-        uniq_vals = np.append(uniq_vals[mask], "DPOther")
-        weights = np.append(weights[mask], other_weight)
+    other_weight = 0
+    small_mask = weights < target_weight
+    if small_mask.any():
+        # Collapse all small bins into the other bin
+        other_weight = weights[small_mask].sum()
+        keep_mask = ~small_mask
+        uniq_vals = uniq_vals[keep_mask]
+        weights = weights[keep_mask]
 
         if other_weight < target_weight:
-            if len(weights) == 1:
+            if weights.size == 0:
                 # since we're adding unbounded random noise, it's possible that the total weight is less than the
                 # threshold required for a single bin.  It could in theory even be negative.
                 # clip to the target_weight
-                weights[0] = target_weight
+                other_weight = target_weight
             else:
-                # If "DPOther" bin is too small, absorb 1 more bin (guaranteed above threshold)
-                collapse_bin = np.argmin(weights[:-1])
-                mask = np.ones(weights.shape, dtype=bool)
-                mask[collapse_bin] = False
+                # If the other bin is too small, absorb 1 more bin (guaranteed above threshold)
+                collapse_bin = np.argmin(weights)
 
-                # Pack data into the final "DPOther" bin
-                weights[-1] += weights[collapse_bin]
+                # Pack data into the other bin
+                other_weight += weights[collapse_bin]
 
-                # Delete absorbed bin
-                uniq_vals = uniq_vals[mask]
-                weights = weights[mask]
+                # Delete absorbed bin by shifting the later bins down over it, which
+                # keeps the order without building a mask
+                uniq_vals[collapse_bin:-1] = uniq_vals[collapse_bin + 1 :]
+                uniq_vals = uniq_vals[:-1]
+                weights[collapse_bin:-1] = weights[collapse_bin + 1 :]
+                weights = weights[:-1]
 
-    return uniq_vals, weights
+    return uniq_vals, weights, other_weight
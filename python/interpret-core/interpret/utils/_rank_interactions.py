@@ -11,6 +11,8 @@ of the interaction of all pairs of features in a dataset.
 
 import heapq
 
+import numpy as np
+
 from ._native import InteractionDetector
 
 
@@ -27,6 +29,12 @@ def rank_interactions(
     experimental_params=None,
     n_output_interactions=0,
 ):
+    if isinstance(iter_term_features, np.ndarray):
+        # unlike a combinations iterator, a (n_terms, n_dimensions) array isn't consumed, so one
+        # compact copy can be shared by every bag.  Convert back to tuples here since callers use
+        # them as keys.
+        iter_term_features = map(tuple, iter_term_features.tolist())
+
     interaction_strengths = []
     with InteractionDetector(
         dataset, bag, init_scores, objective, experimental_params
@@ -3,11 +3,16 @@
 
 import numpy as np
 import math
+import pytest
 
 from interpret.glassbox._ebm._bin import (
     eval_terms,
     make_bin_weights,
     ebm_decision_function,
+    ebm_decision_function_bagged,
+    ebm_decision_function_bagged_lazy,
+    ravel_bin_indexes,
+    take_scores,
 )
 from interpret.utils._clean_x import preclean_X
 
@@ -136,3 +141,79 @@ def test_eval_terms():
     assert math.isclose(scores[1], 7.332000)
     assert math.isclose(scores[2], 7.233668)
     assert math.isclose(scores[3], 7.140300)
+
+    # float32 term tables are accumulated into float64 sample scores
+    float32_scores = ebm_decision_function(
+        X,
+        n_samples,
+        feature_names_in,
+        feature_types_in,
+        bins,
+        np.array([7], dtype=np.float64),
+        [scores.astype(np.float32) for scores in term_scores],
+        term_features,
+    )
+    assert float32_scores.dtype == np.float64
+    assert np.allclose(float32_scores, scores)
+
+    doubled_term_scores = [scores * 2 for scores in term_scores]
+    bagged_scores = ebm_decision_function_bagged(
+        X,
+        n_samples,
+        feature_names_in,
+        feature_types_in,
+        bins,
+        np.array([7], dtype=np.float64),
+        [term_scores, doubled_term_scores],
+        term_features,
+    )
+    assert len(bagged_scores) == 2
+    assert np.allclose(bagged_scores[0], scores)
+    assert np.allclose(bagged_scores[1], (scores - 7) * 2 + 7)
+
+    lazy_scores = list(
+        ebm_decision_function_bagged_lazy(
+            X,
+            n_samples,
+            feature_names_in,
+            feature_types_in,
+            bins,
+            np.array([7], dtype=np.float64),
+            [term_scores, doubled_term_scores, term_scores],
+            term_features,
+            2,
+        )
+    )
+    assert len(lazy_scores) == 3
+    assert np.array_equal(lazy_scores[0], bagged_scores[0])
+    assert np.array_equal(lazy_scores[1], bagged_scores[1])
+    assert np.array_equal(lazy_scores[2], bagged_scores[0])
+
+
+def test_ravel_bin_indexes():
+    rng = np.random.default_rng(0)
+    # the last case is a multiclass pair with 3 scores per bin
+    for shape, n_dimensions in [((5,), 1), ((4, 6), 2), ((3, 4, 5), 3), ((4, 6, 3), 2)]:
+        tensor = rng.random(shape)
+        # -1 is the index used for unknowns, which selects the last bin
+        bin_indexes = [rng.integers(-1, n_bins, 100) for n_bins in shape[:n_dimensions]]
+        flat_indexes = ravel_bin_indexes(bin_indexes, tensor.shape)
+        expected = tensor[tuple(bin_indexes)]
+        assert np.array_equal(take_scores(tensor, flat_indexes, n_dimensions), expected)
+        assert np.array_equal(
+            take_scores(tensor, flat_indexes, n_dimensions, {}), expected
+        )
+
+
+def test_ravel_bin_indexes_out_of_bounds():
+    tensor = np.zeros((4, 6))
+    for bin_indexes in [
+        [np.array([0, 4]), np.array([0, 1])],
+        [np.array([0, 1]), np.array([0, 6])],
+        [np.array([0, 1]), np.array([-7, 1])],
+    ]:
+        with pytest.raises(IndexError):
+            take_scores(tensor, ravel_bin_indexes(bin_indexes, tensor.shape), 2)
+
+    with pytest.raises(IndexError):
+        take_scores(np.zeros(5), ravel_bin_indexes([np.array([5])], (5,)), 1, {})
@@ -582,6 +582,56 @@ def test_ebm_sample_weight():
     assert np.allclose(clf.predict_proba(X_test), clf_u.predict_proba(X_test))
 
 
+def test_ebm_sample_weight_ones():
+    data = synthetic_regression()
+    X_train = data["train"]["X"]
+    y_train = data["train"]["y"]
+    X_test = data["test"]["X"]
+
+    clf = ExplainableBoostingRegressor(outer_bags=2, max_rounds=50, n_jobs=1)
+    clf.fit(X_train, y_train)
+
+    clf_w = ExplainableBoostingRegressor(outer_bags=2, max_rounds=50, n_jobs=1)
+    clf_w.fit(X_train, y_train, sample_weight=np.ones(len(y_train)))
+
+    assert np.array_equal(clf.predict(X_test), clf_w.predict(X_test))
+    assert np.array_equal(clf.bag_weights_, clf_w.bag_weights_)
+
+
+def test_ebm_binary_predict_ties_and_nan():
+    rng = np.random.default_rng(0)
+    X = rng.random((100, 2))
+    y = rng.integers(0, 2, 100)
+    log_odds = np.array([-1.0, 0.0, 1.0, np.nan])
+    for clf in [
+        ExplainableBoostingClassifier(outer_bags=2, max_rounds=20, n_jobs=1),
+        DPExplainableBoostingClassifier(max_rounds=20),
+    ]:
+        clf.fit(X, y)
+        # predict matches argmax over [0, log_odds] for ties and NaN
+        clf.decision_function = lambda X, init_score=None: log_odds
+        assert clf.predict(X[:4]).tolist() == [0, 0, 1, 1]
+
+
+def test_ebm_decision_function_threaded(monkeypatch):
+    from interpret.glassbox._ebm import _ebm
+
+    rng = np.random.default_rng(0)
+    X = rng.random((300, 4))
+    y = rng.integers(0, 3, 300)
+    clf = ExplainableBoostingClassifier(outer_bags=2, max_rounds=50, n_jobs=1)
+    clf.fit(X, y)
+    init_score = rng.random((300, 3))
+    expected = clf.decision_function(X, init_score)
+    expected_df = clf.decision_function(pd.DataFrame(X))
+
+    # force the scoring to be split into blocks of rows on 3 threads
+    monkeypatch.setattr(_ebm, "_min_samples_per_job", 10)
+    clf.n_jobs = 3
+    assert np.array_equal(clf.decision_function(X, init_score), expected)
+    assert np.array_equal(clf.decision_function(pd.DataFrame(X)), expected_df)
+
+
 @pytest.mark.visual
 @pytest.mark.slow
 def test_ebm_iris():
@@ -694,6 +744,26 @@ def test_dp_ebm_synthetic_regression():
     valid_ebm(clf)
 
 
+def test_dp_ebm_no_runtime_warnings():
+    rng = np.random.default_rng(0)
+    X = rng.random((2000, 3))
+    y = rng.integers(0, 2, 2000)
+
+    # the missing value bin has no weight, so it must never be a divisor
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        # the fixed random_state is expected to warn about privacy
+        warnings.filterwarnings("ignore", "Privacy violation", UserWarning)
+        clf = DPExplainableBoostingClassifier(
+            feature_types=["continuous"] * 3,
+            random_state=1,
+            privacy_bounds={0: (0, 1), 1: (0, 1), 2: (0, 1)},
+        )
+        clf.fit(X, y)
+
+    valid_ebm(clf)
+
+
 def test_dp_ebm_external_privacy_bounds():
     from interpret.privacy import DPExplainableBoostingRegressor
 
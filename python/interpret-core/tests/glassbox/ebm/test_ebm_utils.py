@@ -4,6 +4,14 @@ from interpret.glassbox._ebm._utils import (
     convert_categorical_to_continuous,
     _create_proportional_tensor,
     deduplicate_bins,
+    remove_duplicate_terms,
+    jsonify_array,
+    process_terms,
+)
+from interpret.glassbox._ebm._tensor import (
+    make_graph_slices,
+    remove_last,
+    trim_tensor,
 )
 from ...tutils import synthetic_regression, adult_classification
 
@@ -34,6 +42,13 @@ def test_deduplicate_bins():
     assert id(bins[1][1]) != id(bins[1][2])
 
 
+def test_remove_duplicate_terms():
+    terms = [(2, 1), (0, 1), (1, 2), (3,), (0, 2, 1), (1, 0), (4, 3), (2, 0, 1), (3,)]
+    exclude = {(3, 4)}
+
+    assert remove_duplicate_terms(terms, exclude) == [(2, 1), (0, 1), (3,), (0, 2, 1)]
+
+
 @pytest.mark.skip(reason="make_bag test needs to be updated")
 def test_make_bag_regression():
     data = synthetic_regression()
@@ -168,3 +183,57 @@ def test_create_proportional_tensor():
         [[0.55555556, 1.66666667, 0.77777778], [1.11111111, 3.33333333, 1.55555556]]
     )
     assert np.allclose(tensor, expected)
+
+
+def test_make_graph_slices():
+    main_weights = np.array([0, 5, 6, 0], dtype=np.float64)
+    pair_weights = np.array([[1, 2, 0], [3, 4, 0], [0, 0, 0]], dtype=np.float64)
+    pair_weights[2, 0] = 7
+    term_features = [(0,), (0, 1), (1,)]
+    term_bin_weights = [main_weights, pair_weights, None]
+    term_scores = [
+        np.arange(4, dtype=np.float64),
+        np.arange(9, dtype=np.float64).reshape(3, 3),
+        np.arange(5, dtype=np.float64),
+    ]
+
+    graph_slices = make_graph_slices(term_features, term_bin_weights)
+
+    expected = remove_last(term_scores, term_bin_weights)
+    for term_idx, feature_idxs in enumerate(term_features):
+        expected[term_idx] = trim_tensor(
+            expected[term_idx], trim_low=[True] * len(feature_idxs)
+        )
+        assert np.array_equal(
+            term_scores[term_idx][graph_slices[term_idx]], expected[term_idx]
+        )
+
+    assert term_scores[0][graph_slices[0]].tolist() == [1, 2]
+    assert term_scores[1][graph_slices[1]].tolist() == [[4], [7]]
+    assert term_scores[2][graph_slices[2]].tolist() == [1, 2, 3, 4]
+
+
+def test_jsonify_array():
+    vals = np.array([[1.5, np.nan, 2.0], [np.inf, 0.0, -np.inf]])
+    assert jsonify_array(vals) == [[1.5, "NaN", 2.0], ["Infinity", 0.0, "-Infinity"]]
+    assert jsonify_array(np.array([np.nan])) == ["NaN"]
+    assert jsonify_array(np.empty(0)) == []
+
+
+def test_process_terms_zero_weight():
+    bin_weights = [np.array([0.0, 2.0, 3.0, 0.0]), np.zeros(4, np.float64)]
+
+    # binary and regression raise the same error as np.average
+    bagged_scores = [np.ones((2, 4), np.float64), np.ones((2, 4), np.float64)]
+    with pytest.raises(ZeroDivisionError):
+        process_terms(2, bagged_scores, bin_weights, [1.0, 1.0])
+
+    # multiclass divides directly, so the term without weight becomes NaN
+    bagged_scores = [np.ones((2, 4, 3), np.float64), np.ones((2, 4, 3), np.float64)]
+    with pytest.warns(RuntimeWarning):
+        term_scores, _, intercept, _ = process_terms(
+            3, bagged_scores, bin_weights, [1.0, 1.0]
+        )
+    assert np.array_equal(term_scores[0][1:-1], np.zeros((2, 3)))
+    assert np.isnan(term_scores[1][1:-1]).all()
+    assert np.isnan(intercept).all()
@@ -38,6 +38,22 @@ def test_joblib_provider():
     assert results == [2, 4, 6]
 
 
+def test_joblib_provider_sequential():
+    provider = JobLibProvider(n_jobs=1)
+    results = provider.parallel(task_fn, iter(task_args_iter))
+    assert results == [2, 4, 6]
+
+    provider = JobLibProvider(n_jobs=2)
+    results = provider.parallel(task_fn, task_args_iter[:1])
+    assert results == [2]
+
+
+def test_joblib_provider_threading():
+    provider = JobLibProvider(n_jobs=2, backend="threading")
+    results = provider.parallel(task_fn, task_args_iter)
+    assert results == [2, 4, 6]
+
+
 @pytest.mark.slow
 def test_auto_visualize_provider(example_explanation):
     # NOTE: We know this environment is going to use Dash.
@@ -1180,6 +1180,38 @@ def test_encode_categorical_existing_bool_false():
     )
 
 
+def test_encode_categorical_existing_unknowns():
+    c = {"m": 2, "c": 1, "x": 3}
+    encoded, bad = _encode_categorical_existing(
+        np.array(["a", "x", "c", "n", "z", "m"], dtype=np.unicode_), None, c
+    )
+    assert np.array_equal(
+        bad, np.array(["a", None, None, "n", "z", None], dtype=np.object_)
+    )
+    assert np.array_equal(
+        encoded, np.array([-1, c["x"], c["c"], -1, -1, c["m"]], dtype=np.int64)
+    )
+
+
+def test_encode_categorical_existing_empty_categories():
+    encoded, bad = _encode_categorical_existing(
+        np.array(["a", "b"], dtype=np.unicode_), None, {}
+    )
+    assert np.array_equal(bad, np.array(["a", "b"], dtype=np.object_))
+    assert np.array_equal(encoded, np.array([-1, -1], dtype=np.int64))
+
+
+def test_encode_categorical_existing_few_uniques():
+    c = {str(i): i + 1 for i in range(20)}
+    encoded, bad = _encode_categorical_existing(
+        np.array(["7", "z", "7", "12"], dtype=np.unicode_), None, c
+    )
+    assert np.array_equal(bad, np.array([None, "z", None, None], dtype=np.object_))
+    assert np.array_equal(
+        encoded, np.array([c["7"], -1, c["7"], c["12"]], dtype=np.int64)
+    )
+
+
 def test_process_column_initial_choose_floatcategories():
     encoded, c = _process_column_initial(
         np.array(
@@ -1264,6 +1296,29 @@ def test_unify_columns_numpy2():
     )
 
 
+def test_unify_columns_numpy_go_fast():
+    np.random.seed(0)
+    X = np.random.random_sample((20, 10))
+    X, n_samples = preclean_X(X, None, None)
+    assert n_samples == 20
+    feature_names_in = unify_feature_names(X)
+    feature_types_given = ["continuous"] * len(feature_names_in)
+    X_cols = list(
+        unify_columns(
+            X,
+            zip(range(len(feature_names_in)), repeat(None)),
+            feature_names_in,
+            feature_types_given,
+            None,
+            True,
+        )
+    )
+    assert 10 == len(X_cols)
+    for col_idx, (_, X_col, _, _) in enumerate(X_cols):
+        assert X_col.flags.c_contiguous
+        assert np.array_equal(X_col, X[:, col_idx])
+
+
 def test_unify_columns_numpy_ignore():
     X = np.array([["abc", None, "def"], ["ghi", "jkl", None]])
     feature_types_given = ["ignore", "ignore", "ignore"]
@@ -0,0 +1,34 @@
+# Copyright (c) 2023 The InterpretML Contributors
+# Distributed under the MIT software license
+
+import numpy as np
+from sklearn.utils.extmath import softmax  # type: ignore
+
+from interpret.utils._link import link, inv_link
+
+
+def test_inv_link_multiclass():
+    scores = np.random.default_rng(0).normal(size=(20, 4)) * 100
+    expected = softmax(scores)
+    original = scores.copy()
+    probabilities = inv_link("logit", None, scores, 4)
+    assert np.array_equal(probabilities, expected)
+    assert np.allclose(probabilities.sum(axis=1), 1.0)
+    # the scores are left alone unless the caller allows reusing them
+    assert np.array_equal(scores, original)
+
+    probabilities = inv_link("logit", None, scores, 4, copy=False)
+    assert probabilities is scores
+    assert np.array_equal(probabilities, expected)
+
+
+def test_inv_link_binary():
+    scores = np.array([-1000.0, -2.0, 0.0, 3.0, 40.0, 1000.0])
+    probabilities = inv_link("logit", None, scores, 2)
+    assert probabilities.shape == (6, 2)
+    assert np.allclose(probabilities[:, 1], 1.0 / (1.0 + np.exp(-scores)))
+    assert np.allclose(probabilities[:, 0], 1.0 / (1.0 + np.exp(scores)))
+    # the small probability is kept instead of rounding to 1 - p == 0
+    assert 0.0 < probabilities[-2, 0]
+    assert np.allclose(probabilities.sum(axis=1), 1.0)
+    assert np.allclose(link("logit", None, probabilities[1:-1]), scores[1:-1])
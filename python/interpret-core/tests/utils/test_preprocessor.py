@@ -0,0 +1,61 @@
+# Copyright (c) 2023 The InterpretML Contributors
+# Distributed under the MIT software license
+
+import numpy as np
+import pytest
+
+from interpret.utils._preprocessor import EBMPreprocessor
+
+
+def test_preprocessor_n_jobs():
+    np.random.seed(0)
+    X = np.empty((100, 12), np.object_)
+    X[:, :10] = np.random.random_sample((100, 10))
+    X[::7, 3] = np.nan
+    X[:, 10] = np.random.choice(["a", "b", "c"], 100)
+    X[:, 11] = np.random.choice([1, 2, 3, 4], 100)
+    sample_weight = np.random.random_sample(100) + 0.5
+
+    serial = EBMPreprocessor(max_bins=10, n_jobs=1).fit(X, sample_weight=sample_weight)
+    threaded = EBMPreprocessor(max_bins=10, n_jobs=3).fit(
+        X, sample_weight=sample_weight
+    )
+
+    assert serial.feature_types_in_ == threaded.feature_types_in_
+    for bins1, bins2 in zip(serial.bins_, threaded.bins_):
+        if isinstance(bins1, dict):
+            assert bins1 == bins2
+        else:
+            assert np.array_equal(bins1, bins2)
+    for weights1, weights2 in zip(serial.bin_weights_, threaded.bin_weights_):
+        assert np.array_equal(weights1, weights2)
+    for weights1, weights2 in zip(
+        serial.histogram_weights_, threaded.histogram_weights_
+    ):
+        assert np.array_equal(weights1, weights2)
+    assert np.array_equal(
+        serial.feature_bounds_, threaded.feature_bounds_, equal_nan=True
+    )
+    assert np.array_equal(serial.missing_val_counts_, threaded.missing_val_counts_)
+    assert np.array_equal(serial.unique_val_counts_, threaded.unique_val_counts_)
+    assert serial.missing_val_counts_[3] == 15
+
+    assert np.array_equal(serial.transform(X), threaded.transform(X))
+
+
+def test_preprocessor_n_jobs_none():
+    np.random.seed(0)
+    X = np.random.random_sample((100, 3))
+
+    serial = EBMPreprocessor(max_bins=10, n_jobs=1).fit(X)
+    default = EBMPreprocessor(max_bins=10, n_jobs=None).fit(X)
+    for bins1, bins2 in zip(serial.bins_, default.bins_):
+        assert np.array_equal(bins1, bins2)
+    assert np.array_equal(serial.transform(X), default.transform(X))
+
+    with pytest.raises(ValueError):
+        EBMPreprocessor(max_bins=10, n_jobs=0).fit(X)
+
+    # errors found while the columns are being handed out still get raised
+    with pytest.raises(ValueError):
+        EBMPreprocessor(max_bins=2, n_jobs=2).fit(X)